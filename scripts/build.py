@@ -6,34 +6,62 @@ into an .ankiaddon file for distribution.
 """
 
 import argparse
+import hashlib
+import os
+import re
 import shutil
+import stat
 import subprocess
 import sys
+import time
 import tomllib
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from pyproject_version import read_project_version
+
+# Packages bundled into vendor/, installed together in one uv invocation
+VENDOR_PACKAGES = ["beautifulsoup4", "soupsieve", "typing-extensions"]
+
+# Buffer size for the read/write copy fallback
+COPY_BUFSIZE = 1024 * 1024
+
+# Fast path for reading locked versions without a full TOML parse
+_LOCKED_PACKAGE_RE = re.compile(
+    r'^\[\[package\]\]\nname = "([^"]+)"\nversion = "([^"]+)"', re.MULTILINE
+)
+
+# Already-compressed formats that gain nothing from DEFLATE
+PRECOMPRESSED_SUFFIXES = {".whl", ".zip", ".png", ".jpg", ".ico", ".mp3", ".woff2", ".gz"}
+
 
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Build autodefine-cn-vn Anki addon")
     parser.add_argument("--output-dir", type=Path, help="Output directory (default: dist/)")
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Deflate the package (default: store files uncompressed for faster local builds)",
+    )
 
     args = parser.parse_args()
 
     try:
-        build(output_dir=args.output_dir)
+        build(output_dir=args.output_dir, compress=args.compress)
         return 0
     except Exception as e:
         print(f"❌ Build failed: {e}", file=sys.stderr)
         return 1
 
 
-def build(output_dir: Path | None = None) -> Path:
+def build(output_dir: Path | None = None, compress: bool = False) -> Path:
     """Build the Anki addon package.
 
     Args:
         output_dir: Directory for output .ankiaddon file (default: dist/)
+        compress: If True, deflate the package; otherwise store files uncompressed
 
     Returns:
         Path to the created .ankiaddon file
@@ -49,7 +77,7 @@ def build(output_dir: Path | None = None) -> Path:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Get version for output filename
-    version = get_version(pyproject_path)
+    version = read_project_version(pyproject_path)
     output_file = output_dir / f"autodefine_cn_vn-{version}.ankiaddon"
 
     # Remove existing package if present
@@ -82,7 +110,7 @@ def build(output_dir: Path | None = None) -> Path:
     install_vendor_dependencies(vendor_dir, project_root)
 
     # Step 3: Create .ankiaddon package
-    create_ankiaddon_package(build_dir, output_file)
+    create_ankiaddon_package(build_dir, output_file, compress=compress)
 
     print()
     print("✅ Build complete! 🎉")
@@ -104,95 +132,278 @@ def copy_addon_files(src_dir: Path, dest_dir: Path) -> None:
     print(f"📋 Copying addon files from {src_dir} to {dest_dir}...")
 
     # Get git-tracked files from source directory
+    # -z gives NUL-separated, unquoted paths in a single pass over the output
     result = subprocess.run(
-        ["git", "ls-files", str(src_dir)],
+        ["git", "ls-files", "-z", str(src_dir)],
         capture_output=True,
         text=True,
         check=True,
     )
 
-    # Copy each tracked file
-    for file_path in result.stdout.strip().split("\n"):
-        if file_path:  # Skip empty lines
-            src_file = Path(file_path)
-            dest_file = dest_dir / src_file.name
-            shutil.copy2(src_file, dest_file)
+    src_files = [Path(file_path) for file_path in result.stdout.split("\0") if file_path]
+
+    # Copies are independent and IO-bound, so run them concurrently
+    max_workers = min(8, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results so any copy error is raised here
+        list(
+            executor.map(
+                lambda src_file: _fastcopy(src_file, dest_dir / src_file.name),
+                src_files,
+            )
+        )
 
     print("✓ Addon files copied")
 
 
+def _fastcopy(src: Path, dst: Path) -> None:
+    """Copy a file, preserving its permission bits and timestamps.
+
+    Uses os.sendfile on Linux so the data never leaves the kernel, and falls back
+    to a 1 MiB readinto/write loop elsewhere (or if sendfile is unsupported).
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+    """
+    st = os.stat(src)
+
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb") as fdst:
+        copied = False
+        if sys.platform.startswith("linux"):
+            copied = _copy_sendfile(fsrc.fileno(), fdst.fileno())
+
+        if not copied:
+            buf = bytearray(COPY_BUFSIZE)
+            view = memoryview(buf)
+            while n := fsrc.readinto(buf):
+                fdst.write(view[:n])
+
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _copy_sendfile(src_fd: int, dst_fd: int) -> bool:
+    """Copy a whole file between descriptors with os.sendfile.
+
+    Args:
+        src_fd: Source file descriptor
+        dst_fd: Destination file descriptor
+
+    Returns:
+        True if the copy succeeded, False if sendfile is unavailable for these files
+    """
+    offset = 0
+    while True:
+        try:
+            sent = os.sendfile(dst_fd, src_fd, offset, 2**30)
+        except OSError:
+            if offset == 0:
+                return False
+            raise
+        if sent == 0:
+            return True
+        offset += sent
+
+
 def install_vendor_dependencies(vendor_dir: Path, project_root: Path) -> None:
     """Install bs4 and dependencies into vendor directory.
 
+    The installed tree is cached under .cache/vendor/, keyed by the contents of
+    uv.lock, so uv only runs when the locked dependencies change.
+
     Args:
         vendor_dir: Path to vendor directory where packages will be installed
         project_root: Path to project root directory
     """
     print(f"📦 Installing vendor dependencies to {vendor_dir}...")
 
-    # Ensure vendor directory exists
-    vendor_dir.mkdir(parents=True, exist_ok=True)
-
     # Get exact versions from uv.lock
     lock_file = project_root / "uv.lock"
-    versions = get_locked_versions(lock_file, ["beautifulsoup4", "soupsieve", "typing-extensions"])
+    versions = get_locked_versions(lock_file, VENDOR_PACKAGES)
 
     print(f"  Using locked versions: {versions}")
 
-    # Install packages with exact versions using uv
-    packages = [f"{pkg}=={ver}" for pkg, ver in versions.items()]
-    subprocess.run(
-        [
-            "uv",
-            "pip",
-            "install",
-            "--target",
-            str(vendor_dir),
-            "--no-deps",
-            *packages,
-        ],
-        check=True,
-    )
+    cache_dir = get_vendor_cache_dir(project_root, lock_file, versions)
+    # Entries left by the old vendor.zip layout hold only the archive, not the tree
+    if cache_dir.exists() and not (cache_dir / "vendor.zip").exists():
+        print(f"  Using cached vendor tree: {cache_dir}")
+    else:
+        prepare_vendor_cache(cache_dir, versions, uv_cache_dir=project_root / ".cache" / "uv")
 
-    # Clean up unnecessary files
-    for pattern in ["*.dist-info", "*.egg-info", "__pycache__"]:
-        for path in vendor_dir.rglob(pattern):
-            if path.is_dir():
-                shutil.rmtree(path)
-            else:
-                path.unlink()
+    # Hardlink rather than copy: the cache is never modified in place, so the
+    # build tree can share its inodes
+    shutil.copytree(cache_dir, vendor_dir, copy_function=_link_or_copy, dirs_exist_ok=True)
 
     print("✓ Vendor dependencies installed")
 
 
-def create_ankiaddon_package(build_dir: Path, output_file: Path) -> None:
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink a file, falling back to a copy across filesystems.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        # EXDEV (different filesystem) or a filesystem without hardlink support
+        _fastcopy(Path(src), Path(dst))
+
+
+def get_vendor_cache_dir(project_root: Path, lock_file: Path, versions: dict[str, str]) -> Path:
+    """Get the cache directory for a vendor tree built from the given lock file.
+
+    Args:
+        project_root: Path to project root directory
+        lock_file: Path to uv.lock file
+        versions: Dictionary mapping package name to version
+
+    Returns:
+        Path to the cache directory (may not exist yet)
+    """
+    digest = hashlib.blake2b(lock_file.read_bytes() + repr(sorted(versions.items())).encode())
+    return project_root / ".cache" / "vendor" / digest.hexdigest()[:16]
+
+
+def prepare_vendor_cache(cache_dir: Path, versions: dict[str, str], uv_cache_dir: Path) -> None:
+    """Install packages into a fresh vendor cache directory.
+
+    Installs into a temporary directory first and renames it into place, so an
+    interrupted build never leaves a partial cache entry behind.
+
+    uv hardlinks files out of its own cache (kept next to the vendor cache so both
+    are on the same filesystem). Where hardlinks aren't possible uv falls back to
+    copying on its own.
+
+    Args:
+        cache_dir: Cache directory to create
+        versions: Dictionary mapping package name to version
+        uv_cache_dir: Directory for uv's wheel cache
+    """
+    tmp_dir = cache_dir.with_name(cache_dir.name + ".tmp")
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir(parents=True)
+
+    # Install all packages with exact versions in a single uv call
+    packages = [f"{pkg}=={ver}" for pkg, ver in versions.items()]
+    try:
+        subprocess.run(
+            [
+                "uv",
+                "pip",
+                "install",
+                "--quiet",
+                "--target",
+                str(tmp_dir),
+                "--no-deps",
+                *packages,
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+            env={**os.environ, "UV_LINK_MODE": "hardlink", "UV_CACHE_DIR": str(uv_cache_dir)},
+        )
+    except subprocess.CalledProcessError as e:
+        # Output is only captured so it can be shown when the install fails
+        print(e.stderr, file=sys.stderr)
+        raise
+
+    remove_unneeded_files(tmp_dir)
+
+    # Replace any stale entry left by an older cache layout
+    if cache_dir.exists():
+        shutil.rmtree(cache_dir)
+    tmp_dir.rename(cache_dir)
+
+
+def remove_unneeded_files(root_dir: Path) -> None:
+    """Remove package metadata and bytecode caches from an installed tree.
+
+    Removes __pycache__, *.dist-info and *.egg-info entries in a single top-down walk.
+
+    Args:
+        root_dir: Directory to clean up
+    """
+    for root, dirs, files in os.walk(root_dir):
+        for name in list(dirs):
+            if name == "__pycache__" or name.endswith((".dist-info", ".egg-info")):
+                _fast_rmtree(os.path.join(root, name))
+                # Prune the removed directory so the walk doesn't descend into it
+                dirs.remove(name)
+
+        # Old-style installs may leave a single-file *.egg-info
+        for name in files:
+            if name.endswith(".egg-info"):
+                os.unlink(os.path.join(root, name))
+
+
+def _fast_rmtree(path: str) -> None:
+    """Recursively delete a directory using the file types scandir already reports.
+
+    Unlike shutil.rmtree this skips the extra lstat per entry, which adds up over
+    the many small __pycache__ and metadata directories in the vendor tree.
+
+    Args:
+        path: Directory to delete
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def create_ankiaddon_package(build_dir: Path, output_file: Path, compress: bool = False) -> None:
     """Create .ankiaddon package (zip file) from build directory.
 
     Args:
         build_dir: Directory containing addon files to package
         output_file: Output .ankiaddon file path
+        compress: If True, deflate at level 1 (except already-compressed files);
+            otherwise store files uncompressed
     """
     print(f"📦 Creating .ankiaddon package: {output_file}...")
 
-    with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for file in build_dir.rglob("*"):
-            if file.is_file():
-                arcname = file.relative_to(build_dir)
-                zipf.write(file, arcname)
+    # Write entries in a stable order so identical trees give identical packages
+    entries = sorted(
+        ((file, file.relative_to(build_dir).as_posix()) for file in build_dir.rglob("*")),
+        key=lambda entry: entry[1],
+    )
 
-    print(f"✓ Package created: {output_file}")
+    with zipfile.ZipFile(output_file, "w") as zipf:
+        for file, arcname in entries:
+            st = file.stat()
+            if not stat.S_ISREG(st.st_mode):
+                continue
+
+            zinfo = zipfile.ZipInfo(arcname, date_time=time.localtime(st.st_mtime)[:6])
+            zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+            zinfo.file_size = st.st_size
+            if compress and file.suffix not in PRECOMPRESSED_SUFFIXES:
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                # Not exposed publicly on Python 3.12 (compress_level from 3.13)
+                zinfo._compresslevel = 1
+            else:
+                zinfo.compress_type = zipfile.ZIP_STORED
 
+            with open(file, "rb", buffering=0) as src, zipf.open(zinfo, "w") as dest:
+                shutil.copyfileobj(src, dest, COPY_BUFSIZE)
 
-def get_version(pyproject_path: Path) -> str:
-    """Get version from pyproject.toml."""
-    with open(pyproject_path, "rb") as f:
-        data = tomllib.load(f)
-    return data["project"]["version"]
+    print(f"✓ Package created: {output_file}")
 
 
 def get_locked_versions(lock_file: Path, package_names: list[str]) -> dict[str, str]:
     """Get locked package versions from uv.lock.
 
+    Scans the [[package]] headers with a regex and only falls back to a full TOML
+    parse if any requested package isn't found that way.
+
     Args:
         lock_file: Path to uv.lock file
         package_names: List of package names to get versions for
@@ -200,8 +411,15 @@ def get_locked_versions(lock_file: Path, package_names: list[str]) -> dict[str,
     Returns:
         Dictionary mapping package name to version
     """
-    with open(lock_file, "rb") as f:
-        lock_data = tomllib.load(f)
+    text = lock_file.read_text(encoding="utf-8")
+
+    versions = {
+        name: version for name, version in _LOCKED_PACKAGE_RE.findall(text) if name in package_names
+    }
+    if len(versions) == len(set(package_names)):
+        return versions
+
+    lock_data = tomllib.loads(text)
 
     versions = {}
     for package in lock_data.get("package", []):
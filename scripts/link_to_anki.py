@@ -6,6 +6,7 @@ allowing for easier testing during development.
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -16,22 +17,25 @@ def find_anki_addon_folders() -> list[Path]:
     Returns:
         List of paths to Anki2/addons21 directories that exist
     """
-    home = Path.home()
-    potential_locations = [
-        home / "Library/Application Support/Anki2/addons21",
-    ]
-
-    # Also check for different user profiles
-    anki2_base = home / "Library/Application Support/Anki2"
-    if anki2_base.exists():
-        # Look for User 1, User 2, etc.
-        for user_dir in anki2_base.iterdir():
-            if user_dir.is_dir() and user_dir.name.startswith("User"):
-                addons_dir = user_dir / "addons21"
-                if addons_dir.exists() and addons_dir not in potential_locations:
-                    potential_locations.append(addons_dir)
-
-    return [path for path in potential_locations if path.exists()]
+    anki2_base = Path.home() / "Library/Application Support/Anki2"
+
+    # Only append locations already known to exist, so no final exists() pass
+    potential_locations = []
+    if (anki2_base / "addons21").is_dir():
+        potential_locations.append(anki2_base / "addons21")
+
+    # Also check for different user profiles (User 1, User 2, etc.)
+    try:
+        with os.scandir(anki2_base) as it:
+            for entry in it:
+                if entry.name.startswith("User") and entry.is_dir(follow_symlinks=False):
+                    addons_dir = os.path.join(entry.path, "addons21")
+                    if os.path.isdir(addons_dir):
+                        potential_locations.append(Path(addons_dir))
+    except FileNotFoundError:
+        pass
+
+    return potential_locations
 
 
 def select_anki_folder(folders: list[Path], auto_confirm: bool = False) -> Path | None:
@@ -0,0 +1,34 @@
+"""Read the project version from pyproject.toml.
+
+Shared by build.py and release.py.
+"""
+
+import re
+import tomllib
+from pathlib import Path
+
+# Fast path for reading the version without a full TOML parse
+_PROJECT_TABLE_RE = re.compile(r"^\[project\]\s*$(.*?)(?=^\[|\Z)", re.MULTILINE | re.DOTALL)
+_VERSION_LINE_RE = re.compile(r'^version\s*=\s*"([^"]+)"', re.MULTILINE)
+
+
+def read_project_version(pyproject_path: Path) -> str:
+    """Read the [project] version string from pyproject.toml.
+
+    Scans the [project] table with a regex and only falls back to a full TOML
+    parse if the version line isn't in the expected format.
+
+    Args:
+        pyproject_path: Path to pyproject.toml
+
+    Returns:
+        The version string, e.g. '0.2.2'
+    """
+    text = pyproject_path.read_text(encoding="utf-8")
+    project_table = _PROJECT_TABLE_RE.search(text)
+    match = _VERSION_LINE_RE.search(project_table.group(1)) if project_table else None
+    if match:
+        return match.group(1)
+
+    data = tomllib.loads(text)
+    return data["project"]["version"]
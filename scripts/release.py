@@ -3,17 +3,28 @@
 
 import argparse
 import json
+import os
 import re
+import shutil
 import subprocess
 import sys
-import tomllib
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 
+from pyproject_version import read_project_version
 
-@dataclass
+# The version line rewritten on release, and the version format it accepts
+_VERSION_ASSIGNMENT_RE = re.compile(rb'^version = ".*"', re.MULTILINE)
+_SEMVER_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
+
+
+@dataclass(frozen=True, slots=True, order=True)
 class Version:
-    """Semantic version."""
+    """Semantic version.
+
+    Comparisons are generated by the dataclass and order by (major, minor, patch).
+    """
 
     major: int
     minor: int
@@ -22,32 +33,10 @@ class Version:
     def __str__(self) -> str:
         return f"{self.major}.{self.minor}.{self.patch}"
 
-    def __lt__(self, other: "Version") -> bool:
-        """Compare versions."""
-        return (self.major, self.minor, self.patch) < (other.major, other.minor, other.patch)
-
-    def __le__(self, other: "Version") -> bool:
-        """Compare versions."""
-        return (self.major, self.minor, self.patch) <= (other.major, other.minor, other.patch)
-
-    def __gt__(self, other: "Version") -> bool:
-        """Compare versions."""
-        return (self.major, self.minor, self.patch) > (other.major, other.minor, other.patch)
-
-    def __ge__(self, other: "Version") -> bool:
-        """Compare versions."""
-        return (self.major, self.minor, self.patch) >= (other.major, other.minor, other.patch)
-
-    def __eq__(self, other: object) -> bool:
-        """Compare versions."""
-        if not isinstance(other, Version):
-            return False
-        return (self.major, self.minor, self.patch) == (other.major, other.minor, other.patch)
-
     @classmethod
     def parse(cls, version_str: str) -> "Version":
         """Parse a semantic version string."""
-        match = re.match(r"^(\d+)\.(\d+)\.(\d+)$", version_str)
+        match = _SEMVER_RE.match(version_str)
         if not match:
             raise ValueError(f"Invalid version format: {version_str}")
         return cls(
@@ -250,7 +239,7 @@ def release(
 def run_ci_checks() -> bool:
     """Run CI checks (format, lint, test)."""
     try:
-        run_command(["just", "ci"])
+        run_command(["just", "ci"], capture=False)
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ CI checks failed: {e}", file=sys.stderr)
@@ -289,15 +278,29 @@ def rollback_changes(pyproject_path: Path) -> None:
 
 
 def update_version_in_file(pyproject_path: Path, new_version: Version) -> None:
-    """Update version in pyproject.toml."""
-    content = pyproject_path.read_text()
-    updated_content = re.sub(
-        r'^version = ".*"',
-        f'version = "{new_version}"',
-        content,
-        flags=re.MULTILINE,
+    """Update version in pyproject.toml.
+
+    Writes to a temporary file and renames it over the original, so the file is
+    never left half-written.
+    """
+    content = pyproject_path.read_bytes()
+    updated_content = _VERSION_ASSIGNMENT_RE.sub(
+        f'version = "{new_version}"'.encode(), content, count=1
     )
-    pyproject_path.write_text(updated_content)
+    # Reserve a unique name next to pyproject.toml so os.replace stays on one filesystem
+    with tempfile.NamedTemporaryFile(
+        dir=pyproject_path.parent, prefix=".pyproject-", suffix=".toml.tmp", delete=False
+    ) as tmp_file:
+        tmp_path = Path(tmp_file.name)
+    try:
+        tmp_path.write_bytes(updated_content)
+        # NamedTemporaryFile creates the file 0600; keep pyproject.toml's permissions
+        shutil.copymode(pyproject_path, tmp_path)
+        os.replace(tmp_path, pyproject_path)
+    except BaseException:
+        # Don't leave the temporary file behind if writing or replacing failed
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def update_manifest_version(manifest_path: Path, new_version: Version) -> None:
@@ -324,24 +327,38 @@ def update_manifest_version(manifest_path: Path, new_version: Version) -> None:
 
 def check_working_directory_clean() -> bool:
     """Check if git working directory is clean."""
-    result = run_command(["git", "status", "--porcelain"], check=False)
-    # Filter out vhong_todo.md since it's tracked separately
-    output_lines = [line for line in result.stdout.strip().split("\n") if line]
-    filtered_lines = [line for line in output_lines if "vhong_todo.md" not in line]
-    return len(filtered_lines) == 0
+    result = run_command(["git", "status", "--porcelain", "-z"], check=False)
+    # Entries are "XY <path>" separated by NUL. A rename or copy is followed by one
+    # more NUL-separated field holding the original path, without a status prefix.
+    fields = iter(result.stdout.split("\0"))
+    for entry in fields:
+        if not entry:
+            continue
+        paths = [entry[3:]]
+        if "R" in entry[:2] or "C" in entry[:2]:
+            paths.append(next(fields, ""))
+        # Ignore vhong_todo.md since it's tracked separately
+        if any(path != "vhong_todo.md" for path in paths):
+            return False
+    return True
 
 
 def get_current_version(pyproject_path: Path) -> Version:
     """Get the current version from pyproject.toml."""
-    with open(pyproject_path, "rb") as f:
-        data = tomllib.load(f)
-    version_str = data["project"]["version"]
-    return Version.parse(version_str)
+    return Version.parse(read_project_version(pyproject_path))
+
 
+def run_command(
+    cmd: list[str], check: bool = True, capture: bool = True
+) -> subprocess.CompletedProcess:
+    """Run a shell command and return the result.
 
-def run_command(cmd: list[str], check: bool = True) -> subprocess.CompletedProcess:
-    """Run a shell command and return the result."""
+    With capture=False the output streams straight to the terminal instead of
+    being buffered in memory (stdout/stderr on the result are then None).
+    """
     print(f"$ {' '.join(cmd)}")
+    if not capture:
+        return subprocess.run(cmd, check=check)
     return subprocess.run(cmd, capture_output=True, text=True, check=check)
 
 
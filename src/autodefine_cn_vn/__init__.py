@@ -18,6 +18,9 @@ from aqt import mw  # noqa: E402
 from aqt.qt import QAction  # noqa: E402
 from aqt.utils import showInfo  # noqa: E402
 
+from autodefine_cn_vn.config_manager import clear_config_cache  # noqa: E402
+from autodefine_cn_vn.fetcher import fetch_webpage  # noqa: E402
+from autodefine_cn_vn.lookup_cache import get_lookup_cache  # noqa: E402
 from autodefine_cn_vn.ui_hooks import init_ui_hooks  # noqa: E402
 
 
@@ -34,6 +37,16 @@ def setup_menu():
     mw.form.menuTools.addAction(action)
 
 
+def on_config_updated(_config: dict) -> None:
+    """Drop the cached configuration and lookups after the user edits the config in Anki.
+
+    Clearing the persistent lookup cache also lets users recover from a bad cached page.
+    """
+    clear_config_cache()
+    fetch_webpage.cache_clear()
+    get_lookup_cache().clear()
+
+
 def show_settings():
     """Show addon configuration dialog."""
     # TODO: Implement settings dialog
@@ -43,6 +56,7 @@ def show_settings():
 # Initialize addon when Anki profile is loaded
 addHook("profileLoaded", on_addon_loaded)
 
-# Setup menu when main window is available
+# Setup menu and config refresh when main window is available
 if mw:
     setup_menu()
+    mw.addonManager.setConfigUpdatedAction(__name__, on_config_updated)
@@ -2,13 +2,13 @@
 
 import urllib.error
 from typing import TYPE_CHECKING
-from urllib.parse import urlparse
 
 from anki.notes import Note
 
-from autodefine_cn_vn.config_manager import ConfigManager, FieldMapping
+from autodefine_cn_vn.config_manager import FieldMapping, get_config_manager
 from autodefine_cn_vn.fetcher import fetch_audio, fetch_webpage, format_url
-from autodefine_cn_vn.parser import DictionaryContent, parse_dictionary_content
+from autodefine_cn_vn.lookup_cache import get_lookup_cache
+from autodefine_cn_vn.parser import DictionaryContent, ParseFields, parse_dictionary_content
 from autodefine_cn_vn.utils import get_field, notify, set_field
 
 if TYPE_CHECKING:
@@ -24,16 +24,22 @@ def auto_fill(editor: "Editor") -> None:
     Args:
         editor: Anki editor instance
     """
+    config_manager = get_config_manager()
+    field_mapping = config_manager.get_field_mapping()
+    api_settings = config_manager.get_api_settings()
+
     # Get Chinese text from source field
-    chinese_text = get_chinese_text(editor)
+    chinese_text = get_chinese_text(editor, field_mapping)
 
     if not chinese_text:
         notify("AutoDefine: No Chinese text found in source field.")
         return
 
-    config_manager = ConfigManager()
-    field_mapping = config_manager.get_field_mapping()
-    api_settings = config_manager.get_api_settings()
+    # Nothing to fill, so don't fetch the page at all
+    parse_fields = get_parse_fields(field_mapping)
+    if not parse_fields:
+        notify("AutoDefine: No target fields configured. Please check your configuration.")
+        return
 
     # Format URL and fetch webpage
     url_template = api_settings.source
@@ -41,17 +47,29 @@ def auto_fill(editor: "Editor") -> None:
     url = format_url(url_template, chinese_text)
 
     try:
-        html_content = fetch_webpage(url, timeout)
-        parsed_data = parse_dictionary_content(html_content)
-
-        # Fill fields using helper methods
-        pinyin_filled = fill_pinyin_field(editor, parsed_data, field_mapping)
-        vietnamese_filled = fill_vietnamese_field(editor, parsed_data, field_mapping)
-        sentence_filled = fill_sentence_field(editor, parsed_data, field_mapping, chinese_text)
-        _ = fill_audio_field(
-            editor, parsed_data, field_mapping, chinese_text, url_template, timeout
+        parsed_data = lookup_dictionary_content(url, timeout, parse_fields)
+
+        # Fill fields using helper methods, then refresh the editor once for all of them
+        pinyin_filled = fill_pinyin_field(editor, parsed_data, field_mapping, load_note=False)
+        vietnamese_filled = fill_vietnamese_field(
+            editor, parsed_data, field_mapping, load_note=False
+        )
+        sentence_filled = fill_sentence_field(
+            editor, parsed_data, field_mapping, chinese_text, load_note=False
+        )
+        audio_filled = fill_audio_field(
+            editor,
+            parsed_data,
+            field_mapping,
+            chinese_text,
+            api_settings.base_url,
+            timeout,
+            load_note=False,
         )
 
+        if pinyin_filled or vietnamese_filled or sentence_filled or audio_filled:
+            editor.loadNote()
+
         if pinyin_filled or vietnamese_filled or sentence_filled:
             notify(f"AutoDefine: Successfully filled fields for '{chinese_text}'")
         else:
@@ -77,8 +95,59 @@ def auto_fill(editor: "Editor") -> None:
         )
 
 
+def lookup_dictionary_content(url: str, timeout: int, fields: ParseFields) -> DictionaryContent:
+    """Get parsed dictionary content from the persistent cache, or fetch and parse it.
+
+    Args:
+        url: Dictionary page URL
+        timeout: Request timeout in seconds
+        fields: Parts of the page to extract
+
+    Returns:
+        Parsed dictionary content.
+
+    Raises:
+        urllib.error.URLError: If there's a network error or timeout
+        urllib.error.HTTPError: If the server returns an HTTP error
+    """
+    lookup_cache = get_lookup_cache()
+    cached = lookup_cache.get(url, fields)
+    if cached is not None:
+        return cached
+
+    html_content = fetch_webpage(url, timeout)
+    parsed_data = parse_dictionary_content(html_content, fields=fields)
+    lookup_cache.put(url, fields, parsed_data)
+    return parsed_data
+
+
+def get_parse_fields(field_mapping: FieldMapping) -> ParseFields:
+    """Get the parts of the dictionary page needed to fill the configured fields.
+
+    Args:
+        field_mapping: Field mapping configuration object
+
+    Returns:
+        ParseFields flags for every configured target field.
+    """
+    fields = ParseFields(0)
+    if field_mapping.pinyin_field:
+        fields |= ParseFields.PINYIN
+    if field_mapping.vietnamese_field:
+        fields |= ParseFields.VIETNAMESE
+    if field_mapping.audio_field:
+        fields |= ParseFields.AUDIO
+    if field_mapping.sentence_field:
+        fields |= ParseFields.SENTENCES
+    return fields
+
+
 def fill_pinyin_field(
-    editor: "Editor", parsed_data: DictionaryContent, field_mapping: FieldMapping
+    editor: "Editor",
+    parsed_data: DictionaryContent,
+    field_mapping: FieldMapping,
+    *,
+    load_note: bool = True,
 ) -> bool:
     """Fill pinyin field from parsed data.
 
@@ -86,6 +155,8 @@ def fill_pinyin_field(
         editor: Anki editor instance
         parsed_data: DictionaryContent containing parsed data
         field_mapping: Field mapping configuration object
+        load_note: If True, reload the editor after the change; pass False when
+            batching several field updates
 
     Returns:
         bool: True if pinyin was filled, False otherwise
@@ -101,13 +172,18 @@ def fill_pinyin_field(
             pinyin,
             field_mapping.pinyin_field,
             overwrite=True,
+            load_note=load_note,
         )
         return True
     return False
 
 
 def fill_vietnamese_field(
-    editor: "Editor", parsed_data: DictionaryContent, field_mapping: FieldMapping
+    editor: "Editor",
+    parsed_data: DictionaryContent,
+    field_mapping: FieldMapping,
+    *,
+    load_note: bool = True,
 ) -> bool:
     """Fill vietnamese field from parsed data.
 
@@ -115,6 +191,8 @@ def fill_vietnamese_field(
         editor: Anki editor instance
         parsed_data: DictionaryContent containing parsed data
         field_mapping: Field mapping configuration object
+        load_note: If True, reload the editor after the change; pass False when
+            batching several field updates
 
     Returns:
         bool: True if vietnamese was filled, False otherwise
@@ -132,6 +210,7 @@ def fill_vietnamese_field(
             vietnamese_text,
             field_mapping.vietnamese_field,
             overwrite=True,
+            load_note=load_note,
         )
         return True
     return False
@@ -142,6 +221,8 @@ def fill_sentence_field(
     parsed_data: DictionaryContent,
     field_mapping: FieldMapping,
     chinese_word: str,
+    *,
+    load_note: bool = True,
 ) -> bool:
     """Fill sentence field with all sample sentences from parsed data.
 
@@ -150,6 +231,8 @@ def fill_sentence_field(
         parsed_data: DictionaryContent containing parsed data including sentences
         field_mapping: Field mapping configuration object
         chinese_word: Chinese word being learned to highlight in sentence
+        load_note: If True, reload the editor after the change; pass False when
+            batching several field updates
 
     Returns:
         bool: True if sentence was filled, False otherwise
@@ -162,13 +245,13 @@ def fill_sentence_field(
     if not sentences:
         return False
 
-    highlighted_sentences = []
-    for sentence in sentences:
-        chinese = sentence.get("chinese", "")
-        if chinese:
-            # Highlight the Chinese word being learned with <b> tags
-            highlighted_sentence = chinese.replace(chinese_word, f"<b>{chinese_word}</b>")
-            highlighted_sentences.append(highlighted_sentence)
+    # Highlight the Chinese word being learned with <b> tags
+    highlighted_word = f"<b>{chinese_word}</b>"
+    highlighted_sentences = [
+        sentence["chinese"].replace(chinese_word, highlighted_word)
+        for sentence in sentences
+        if sentence.get("chinese")
+    ]
 
     if highlighted_sentences:
         # Join multiple sentences with <br> tags
@@ -178,6 +261,7 @@ def fill_sentence_field(
             combined_sentences,
             field_mapping.sentence_field,
             overwrite=True,
+            load_note=load_note,
         )
         return True
 
@@ -189,8 +273,10 @@ def fill_audio_field(
     parsed_data: DictionaryContent,
     field_mapping: FieldMapping,
     chinese_text: str,
-    url_template: str,
+    base_url: str,
     timeout: int,
+    *,
+    load_note: bool = True,
 ) -> bool:
     """Download audio and fill audio field.
 
@@ -199,8 +285,10 @@ def fill_audio_field(
         parsed_data: DictionaryContent containing parsed data including audio_url
         field_mapping: Field mapping configuration object
         chinese_text: Chinese text used for filename generation
-        url_template: Template URL to extract base URL from
+        base_url: Base URL of the dictionary site (e.g., 'http://2.vndic.net')
         timeout: Timeout for audio download in seconds
+        load_note: If True, reload the editor after the change; pass False when
+            batching several field updates
 
     Returns:
         bool: True if audio was filled, False otherwise
@@ -218,7 +306,7 @@ def fill_audio_field(
             editor.note,
             audio_url,
             chinese_text,
-            url_template,
+            base_url,
             timeout,
         )
         # Insert audio reference into audio field
@@ -228,6 +316,7 @@ def fill_audio_field(
             audio_reference,
             field_mapping.audio_field,
             overwrite=True,
+            load_note=load_note,
         )
         return True
     except Exception as e:
@@ -243,16 +332,19 @@ def download_audio(
     note: Note,
     audio_url: str,
     chinese_text: str,
-    url_template: str,
+    base_url: str,
     timeout: int,
 ) -> str:
     """Download audio file and save to Anki's media collection.
 
+    If the media collection already has audio for this word, it is reused
+    without downloading.
+
     Args:
         note: Anki note instance
         audio_url: URL of the audio file to download
         chinese_text: Chinese text used for filename generation
-        url_template: Template URL to extract base URL from
+        base_url: Base URL of the dictionary site (e.g., 'http://2.vndic.net')
         timeout: Timeout for audio download in seconds
 
     Returns:
@@ -261,34 +353,35 @@ def download_audio(
     Raises:
         Exception: If audio download or save fails
     """
-    # Extract base URL from the source URL
-    parsed_url = urlparse(url_template)
-    base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-
-    # Download audio file
-    audio_data = fetch_audio(audio_url, base_url, timeout)
-
     # Generate filename from Chinese text
     # Use sanitized filename with .mp3 extension
     safe_filename = f"autodefine_cn_vn_{chinese_text}.mp3"
 
+    # Reuse audio downloaded for an earlier card instead of fetching it again
+    if note.col.media.have(safe_filename):
+        return safe_filename
+
+    # Download audio file
+    audio_data = fetch_audio(audio_url, base_url, timeout)
+
     # Write audio to Anki's media collection
     filename = note.col.media.write_data(safe_filename, audio_data)
 
     return filename
 
 
-def get_chinese_text(editor: "Editor") -> str:
+def get_chinese_text(editor: "Editor", field_mapping: FieldMapping | None = None) -> str:
     """Extract Chinese text from the configured source field.
 
     Args:
         editor: Anki editor instance
+        field_mapping: Field mapping to use; read from the config if not given
 
     Returns:
         str: Chinese text from the configured field
     """
-    config_manager = ConfigManager()
-    field_mapping = config_manager.get_field_mapping()
+    if field_mapping is None:
+        field_mapping = get_config_manager().get_field_mapping()
     chinese_field_name = field_mapping.chinese_field
 
     # Get the note and find the Chinese field
@@ -303,7 +396,12 @@ def get_chinese_text(editor: "Editor") -> str:
 
 
 def insert_into_field(
-    editor: "Editor", text: str, field_name: str, overwrite: bool = False
+    editor: "Editor",
+    text: str,
+    field_name: str,
+    overwrite: bool = False,
+    *,
+    load_note: bool = True,
 ) -> None:
     """Insert text into a specific field by name.
 
@@ -312,6 +410,8 @@ def insert_into_field(
         text: Text to insert
         field_name: Name of the field to insert into
         overwrite: If True, replace existing content; if False, append
+        load_note: If True, reload the editor after the change; pass False when
+            batching several field updates
     """
     note: Note | None = editor.note
     if not note:
@@ -331,4 +431,5 @@ def insert_into_field(
         )
         return
 
-    editor.loadNote()
+    if load_note:
+        editor.loadNote()
@@ -1,11 +1,16 @@
 """Configuration manager for AutoDefine Chinese-Vietnamese addon."""
 
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
 
 from aqt import mw
 
+_ADDON_NAME = __name__.split(".")[0]
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class FieldMapping:
     """Field name mappings for Anki note fields.
 
@@ -20,20 +25,29 @@ class FieldMapping:
     sentence_field: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Shortcuts:
     """Keyboard shortcut configurations."""
 
     auto_define_shortcut: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ApiSettings:
-    """API settings for fetching definitions."""
+    """API settings for fetching definitions.
+
+    base_url is derived from source once, so audio downloads don't re-parse it.
+    """
 
     source: str
     timeout_seconds: int
     max_retries: int
+    base_url: str = field(init=False)
+
+    def __post_init__(self):
+        """Derive the dictionary site's base URL from the source URL template."""
+        parsed_url = urlparse(self.source)
+        object.__setattr__(self, "base_url", f"{parsed_url.scheme}://{parsed_url.netloc}")
 
 
 DEFAULT_API_SETTINGS = ApiSettings(
@@ -43,7 +57,7 @@ DEFAULT_API_SETTINGS = ApiSettings(
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config:
     """Complete addon configuration."""
 
@@ -58,7 +72,8 @@ class ConfigManager:
 
     def __init__(self):
         """Initialize the config manager and load configuration."""
-        self._config: Config = self._load_config()
+        self._raw_config: dict[str, Any] = _load_raw_config(_ADDON_NAME)
+        self._config: Config = self._build_config(self._raw_config)
 
     def get_config(self) -> Config:
         """Get complete configuration.
@@ -93,24 +108,72 @@ class ConfigManager:
         return self._config.api_settings
 
     def reload_config(self) -> None:
-        """Reload configuration from Anki's addon manager."""
-        self._config = self._load_config()
+        """Reload configuration from Anki's addon manager.
+
+        The dataclasses are only rebuilt if the config actually changed. Only the
+        cached config dict is dropped, so this instance stays the shared one.
+        """
+        _load_raw_config.cache_clear()
+        config_dict = _load_raw_config(_ADDON_NAME)
+        if config_dict == self._raw_config:
+            return
+
+        self._raw_config = config_dict
+        self._config = self._build_config(config_dict)
 
-    def _load_config(self) -> Config:
-        """Load configuration from Anki's addon manager.
+    @staticmethod
+    def _build_config(config_dict: dict[str, Any]) -> Config:
+        """Build the typed configuration from the raw addon config.
+
+        Args:
+            config_dict: Raw configuration dictionary
 
         Returns:
             Configuration object constructed from addon settings.
         """
-        addon_name = __name__.split(".")[0]
-        config_dict = mw.addonManager.getConfig(addon_name)
-
-        if not config_dict:
-            raise ValueError("Failed to load configuration for AutoDefine CN-VN addon.")
-
         return Config(
             version=config_dict["version"],
             field_mapping=FieldMapping(**config_dict["field_mapping"]),
             shortcuts=Shortcuts(**config_dict["shortcuts"]),
             api_settings=DEFAULT_API_SETTINGS,
         )
+
+
+@functools.cache
+def get_config_manager() -> ConfigManager:
+    """Get the shared ConfigManager instance, creating it on first use.
+
+    Returns:
+        Process-wide ConfigManager.
+    """
+    return ConfigManager()
+
+
+def clear_config_cache() -> None:
+    """Drop the cached addon config so the next load re-reads it from Anki."""
+    get_config_manager.cache_clear()
+    _load_raw_config.cache_clear()
+
+
+@functools.cache
+def _load_raw_config(addon_name: str) -> dict[str, Any]:
+    """Read the addon config dict from Anki's addon manager.
+
+    Cached so that every ConfigManager shares one read of the config files;
+    call clear_config_cache() when the config changes.
+
+    Args:
+        addon_name: Addon package name
+
+    Returns:
+        Raw configuration dictionary.
+
+    Raises:
+        ValueError: If Anki returns no configuration for the addon.
+    """
+    config_dict = mw.addonManager.getConfig(addon_name)
+
+    if not config_dict:
+        raise ValueError("Failed to load configuration for AutoDefine CN-VN addon.")
+
+    return config_dict
@@ -1,7 +1,21 @@
 """Functions for fetching web content from Chinese-Vietnamese dictionary."""
 
+import functools
+import urllib.error
 import urllib.parse
-import urllib.request
+
+import urllib3
+
+# Shared pool so repeated lookups reuse kept-alive connections to the dictionary
+# site instead of paying a TCP handshake per request. Lookups run one at a time
+# on the editor's thread, so urllib3's default of one connection per host is enough.
+_HTTP = urllib3.PoolManager(
+    num_pools=4,
+    # Ask for compressed bodies; urllib3 decompresses them transparently
+    headers=urllib3.make_headers(accept_encoding=True),
+    # Follow redirects like urlopen did, but don't silently retry failed requests
+    retries=urllib3.Retry(total=None, connect=0, read=0, other=0, redirect=10),
+)
 
 
 def format_url(url_template: str, chinese_word: str) -> str:
@@ -18,13 +32,20 @@ def format_url(url_template: str, chinese_word: str) -> str:
         >>> format_url("http://example.com?word={}", "你好")
         'http://example.com?word=%E4%BD%A0%E5%A5%BD'
     """
-    encoded_word = urllib.parse.quote(chinese_word)
-    return url_template.format(encoded_word)
+    prefix, placeholder, suffix = _split_url_template(url_template)
+    if not placeholder:
+        return url_template
+    return prefix + _quote(chinese_word) + suffix
 
 
+@functools.lru_cache(maxsize=256)
 def fetch_webpage(url: str, timeout: int) -> str:
     """Fetch webpage content from the given URL.
 
+    Results are cached per URL for the session, so looking up the same word again
+    doesn't hit the network. Failed fetches are not cached. Call
+    fetch_webpage.cache_clear() to force fresh lookups.
+
     Args:
         url: The URL to fetch
         timeout: Request timeout in seconds
@@ -40,9 +61,8 @@ def fetch_webpage(url: str, timeout: int) -> str:
         Uses errors='replace' to handle malformed UTF-8 sequences in HTML meta tags.
         Invalid bytes are replaced with the Unicode replacement character (�).
     """
-    with urllib.request.urlopen(url, timeout=timeout) as response:
-        content_bytes = response.read()
-        return content_bytes.decode("utf-8", errors="replace")
+    content_bytes = _get(url, timeout)
+    return content_bytes.decode("utf-8", errors="replace")
 
 
 def fetch_audio(audio_url: str, base_url: str, timeout: int) -> bytes:
@@ -63,5 +83,45 @@ def fetch_audio(audio_url: str, base_url: str, timeout: int) -> bytes:
     # Construct full URL if audio_url is relative
     full_url = base_url.rstrip("/") + audio_url if audio_url.startswith("/") else audio_url
 
-    with urllib.request.urlopen(full_url, timeout=timeout) as response:
-        return response.read()
+    return _get(full_url, timeout)
+
+
+def _get(url: str, timeout: int) -> bytes:
+    """Send a GET request through the shared connection pool.
+
+    urllib3 errors are translated to their urllib equivalents so callers can keep
+    handling a single set of exceptions.
+
+    Args:
+        url: The URL to fetch
+        timeout: Request timeout in seconds
+
+    Returns:
+        The response body as bytes
+
+    Raises:
+        urllib.error.URLError: If there's a network error or timeout
+        urllib.error.HTTPError: If the server returns an HTTP error (404, 500, etc.)
+    """
+    try:
+        response = _HTTP.request("GET", url, timeout=timeout)
+    except urllib3.exceptions.MaxRetryError as e:
+        raise urllib.error.URLError(e.reason) from e
+    except urllib3.exceptions.HTTPError as e:
+        raise urllib.error.URLError(e) from e
+
+    if response.status >= 400:
+        raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+    return response.data
+
+
+@functools.lru_cache(maxsize=1024)
+def _quote(chinese_word: str) -> str:
+    """URL-encode a word, caching results since the same words are looked up repeatedly."""
+    return urllib.parse.quote(chinese_word)
+
+
+@functools.lru_cache(maxsize=16)
+def _split_url_template(url_template: str) -> tuple[str, str, str]:
+    """Split a URL template around its {} placeholder, so formatting is a concatenation."""
+    return url_template.partition("{}")
@@ -0,0 +1,138 @@
+"""Persistent cache of parsed dictionary lookups."""
+
+import contextlib
+import functools
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+from aqt import mw
+
+from autodefine_cn_vn.parser import DictionaryContent, ParseFields
+
+# Cached lookups older than this are fetched again
+CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+CACHE_FILENAME = "lookup_cache.sqlite"
+
+# Stored with every row; rows written under another version are cache misses.
+# Bump whenever DictionaryContent or the parser's output changes.
+CACHE_VERSION = 1
+
+
+class LookupCache:
+    """SQLite-backed cache of parsed dictionary pages, keyed by request URL.
+
+    Lookups survive Anki restarts, so words seen before need neither a network
+    request nor an HTML parse. Database errors are treated as cache misses.
+    Lookups that found nothing are not stored, so a transient error page doesn't
+    hide a word until its entry expires.
+    """
+
+    def __init__(self, db_path: Path, ttl_seconds: int = CACHE_TTL_SECONDS):
+        """Initialize the cache, creating the database if needed.
+
+        Args:
+            db_path: Path of the SQLite database file
+            ttl_seconds: Age after which a cached lookup is ignored
+        """
+        self._db_path = db_path
+        self._ttl_seconds = ttl_seconds
+        with contextlib.suppress(sqlite3.Error), self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS lookups (url TEXT PRIMARY KEY, "
+                "fetched_at INTEGER, fields INTEGER, content TEXT, version INTEGER)"
+            )
+        # Databases created before rows were versioned get the column; their rows
+        # have a NULL version and are therefore misses
+        with contextlib.suppress(sqlite3.Error), self._connect() as conn:
+            conn.execute("ALTER TABLE lookups ADD COLUMN version INTEGER")
+
+    def get(self, url: str, fields: ParseFields) -> DictionaryContent | None:
+        """Get a cached lookup that covers the requested fields.
+
+        Args:
+            url: Dictionary page URL
+            fields: Parts of the page the caller needs
+
+        Returns:
+            Cached dictionary content, or None if missing, expired, written by a
+            different CACHE_VERSION, or parsed with fewer fields than requested.
+        """
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT fetched_at, fields, content FROM lookups WHERE url = ? AND version = ?",
+                    (url, CACHE_VERSION),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            return None
+
+        fetched_at, cached_fields, content = row
+        if time.time() - fetched_at > self._ttl_seconds:
+            return None
+        if fields & ~ParseFields(cached_fields):
+            return None
+
+        return json.loads(content)
+
+    def put(self, url: str, fields: ParseFields, content: DictionaryContent) -> None:
+        """Store a parsed lookup, replacing any earlier entry for the URL.
+
+        Empty lookups (no pinyin, definitions, sentences, or audio) are skipped,
+        since they may come from an error or maintenance page.
+
+        Args:
+            url: Dictionary page URL
+            fields: Parts of the page that were parsed into content
+            content: Parsed dictionary content
+        """
+        if not any(content.get(key) for key in ("pinyin", "vietnamese", "sentences", "audio_url")):
+            return
+
+        with contextlib.suppress(sqlite3.Error), self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO lookups (url, fetched_at, fields, content, version) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    url,
+                    int(time.time()),
+                    fields.value,
+                    json.dumps(content, ensure_ascii=False),
+                    CACHE_VERSION,
+                ),
+            )
+
+    def clear(self) -> None:
+        """Remove all cached lookups."""
+        with contextlib.suppress(sqlite3.Error), self._connect() as conn:
+            conn.execute("DELETE FROM lookups")
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """Open a connection for one transaction and close it afterwards."""
+        conn = sqlite3.connect(self._db_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+
+@functools.cache
+def get_lookup_cache() -> LookupCache:
+    """Get the shared LookupCache stored in the addon's user_files folder.
+
+    Anki keeps user_files when the addon is updated, so the cache persists.
+
+    Returns:
+        Process-wide LookupCache.
+    """
+    addon_name = __name__.split(".")[0]
+    user_files = Path(mw.addonManager.addonsFolder(addon_name)) / "user_files"
+    user_files.mkdir(parents=True, exist_ok=True)
+    return LookupCache(user_files / CACHE_FILENAME)
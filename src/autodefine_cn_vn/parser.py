@@ -1,8 +1,48 @@
 """Functions for parsing Chinese-Vietnamese dictionary HTML content."""
 
-from typing import TypedDict
+import enum
+import html
+import importlib.util
+import re
+from typing import TYPE_CHECKING, TypedDict
 
-from bs4 import BeautifulSoup
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, Tag
+
+# lxml's C tokenizer is considerably faster than the pure-Python html.parser and
+# builds the same tree for vndic.net pages. It isn't bundled with Anki, so fall
+# back to html.parser when it isn't installed.
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# Only build tree nodes for the tags the extraction looks at. Scripts, styles, and
+# page chrome outside tables are skipped while parsing. table and tbody are kept so
+# rows stay grouped by table and a sibling-row lookup can't run into the next table.
+_PARSE_ONLY_TAGS = ["table", "tbody", "tr", "td", "font", "img"]
+
+# Marker images vndic.net puts in front of each definition and sample sentence
+DEFINITION_MARKER = "img/dict/CB1FF077.png"
+SENTENCE_MARKER = "img/dict/72B02D27.png"
+
+# The audio URL is the quoted argument of the speaker icon's onclick handler. It is
+# read straight from the raw HTML, so no tree walk is needed for it.
+_AUDIO_URL_RE = re.compile(
+    r"""<span\b[^>]*\bonclick\s*=\s*["'][^"']*?soundManager\.play\([^']*'([^']*)'""",
+    re.IGNORECASE,
+)
+
+# Attribute matchers, compiled once so bs4 checks them with re instead of a Python callback
+_CHINESE_COLOR_RE = re.compile(r"^#ff0000$", re.IGNORECASE)
+_VIETNAMESE_COLOR_RE = re.compile(r"^#7f7f7f$", re.IGNORECASE)
+
+
+class ParseFields(enum.Flag):
+    """Parts of a dictionary page that parse_dictionary_content should extract."""
+
+    PINYIN = enum.auto()
+    VIETNAMESE = enum.auto()
+    AUDIO = enum.auto()
+    SENTENCES = enum.auto()
+    ALL = PINYIN | VIETNAMESE | AUDIO | SENTENCES
 
 
 class SampleSentence(TypedDict):
@@ -21,11 +61,14 @@ class DictionaryContent(TypedDict):
     sentences: list[SampleSentence]
 
 
-def parse_dictionary_content(html_content: str) -> DictionaryContent:
+def parse_dictionary_content(
+    html_content: str, *, fields: ParseFields = ParseFields.ALL
+) -> DictionaryContent:
     """Parse pinyin, Vietnamese definition, audio URL, and sample sentences from dictionary HTML content.
 
     Args:
         html_content: The HTML content to parse
+        fields: Which parts to extract; parts not requested are left empty
 
     Returns:
         Dictionary with 'pinyin', 'vietnamese', 'audio_url', and 'sentences' keys.
@@ -37,46 +80,53 @@ def parse_dictionary_content(html_content: str) -> DictionaryContent:
         >>> result['pinyin']
         'gōngjīn'
     """
-    soup = BeautifulSoup(html_content, "html.parser")
+    soup = _make_soup(html_content)
 
     # Extract pinyin from <FONT COLOR=#7F0000> tag
     pinyin = ""
-    font_tag = soup.find("font", {"color": "#7F0000"})
-    if font_tag:
-        pinyin = font_tag.get_text(strip=True)
-        # Remove square brackets if present
-        if pinyin.startswith("[") and pinyin.endswith("]"):
-            pinyin = pinyin[1:-1]
+    if ParseFields.PINYIN in fields:
+        font_tag = soup.find("font", {"color": "#7F0000"})
+        if font_tag:
+            pinyin = font_tag.get_text(strip=True)
+            # Remove square brackets if present
+            if pinyin.startswith("[") and pinyin.endswith("]"):
+                pinyin = pinyin[1:-1]
+
+    # Collect both kinds of marker images in a single pass over the tree
+    definition_markers: list[Tag] = []
+    sentence_markers: list[Tag] = []
+    if fields & (ParseFields.VIETNAMESE | ParseFields.SENTENCES):
+        definition_markers, sentence_markers = _find_marker_images(soup)
 
     # Extract all Vietnamese definitions by finding all TDs after marker images
     vietnamese_definitions = []
-    # Find all img tags with the specific marker image
-    marker_imgs = soup.find_all("img", src=lambda x: bool(x) and "img/dict/CB1FF077.png" in x)
-    for marker_img in marker_imgs:
-        # Find the parent TD of the marker image
-        marker_td = marker_img.find_parent("td")
-        if marker_td:
-            # Get the next sibling TD which contains the Vietnamese definition
-            next_td = marker_td.find_next_sibling("td")
-            if next_td:
-                definition = next_td.get_text(strip=True)
-                if definition:
-                    vietnamese_definitions.append(definition)
+    if ParseFields.VIETNAMESE in fields:
+        for marker_img in definition_markers:
+            # Find the parent TD of the marker image
+            marker_td = marker_img.find_parent("td")
+            if marker_td:
+                # Get the next sibling TD which contains the Vietnamese definition
+                next_td = marker_td.find_next_sibling("td")
+                if next_td:
+                    definition = next_td.get_text(strip=True)
+                    if definition:
+                        vietnamese_definitions.append(definition)
 
     # Return list of Vietnamese definitions (UI layer will handle joining)
     vietnamese = vietnamese_definitions
 
     # Extract audio URL from soundManager.play() call
     audio_url = ""
-    audio_span = soup.find("span", onclick=lambda x: bool(x) and "soundManager.play" in x)
-    if audio_span:
-        onclick = audio_span.get("onclick", "")
-        start_idx = onclick.find("'") + 1
-        end_idx = onclick.find("'", start_idx)
-        audio_url = onclick[start_idx:end_idx]
+    if ParseFields.AUDIO in fields:
+        audio_match = _AUDIO_URL_RE.search(html_content)
+        if audio_match:
+            # Unescape entities like &amp; the way an HTML parser would
+            audio_url = html.unescape(audio_match.group(1))
 
-    # Extract sample sentences
-    sentences = parse_sample_sentences(html_content)
+    # Extract sample sentences from the same tree
+    sentences = []
+    if ParseFields.SENTENCES in fields:
+        sentences = _extract_sample_sentences(sentence_markers)
 
     return {
         "pinyin": pinyin,
@@ -104,11 +154,58 @@ def parse_sample_sentences(html_content: str) -> list[SampleSentence]:
         >>> result[0]['chinese']
         '我爱你。'
     """
-    soup = BeautifulSoup(html_content, "html.parser")
-    sentences = []
+    soup = _make_soup(html_content)
+    _, sentence_markers = _find_marker_images(soup)
+    return _extract_sample_sentences(sentence_markers)
+
+
+def _make_soup(html_content: str) -> "BeautifulSoup":
+    """Parse HTML into a soup restricted to the tags the extraction uses.
 
-    # Find all images that mark sample sentences
-    sentence_markers = soup.find_all("img", src=lambda x: bool(x) and "img/dict/72B02D27.png" in x)
+    bs4 is imported here rather than at module level so that it only loads on the
+    first lookup instead of slowing down Anki's startup.
+
+    Args:
+        html_content: The HTML content to parse
+
+    Returns:
+        Parsed soup.
+    """
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    return BeautifulSoup(html_content, HTML_PARSER, parse_only=SoupStrainer(_PARSE_ONLY_TAGS))
+
+
+def _find_marker_images(soup: "BeautifulSoup") -> tuple[list["Tag"], list["Tag"]]:
+    """Find definition and sample sentence marker images in one pass.
+
+    Args:
+        soup: The parsed dictionary page
+
+    Returns:
+        Tuple of (definition markers, sentence markers), each in document order.
+    """
+    definition_markers = []
+    sentence_markers = []
+    for img in soup.find_all("img", src=True):
+        src = img["src"]
+        if DEFINITION_MARKER in src:
+            definition_markers.append(img)
+        elif SENTENCE_MARKER in src:
+            sentence_markers.append(img)
+    return definition_markers, sentence_markers
+
+
+def _extract_sample_sentences(sentence_markers: list["Tag"]) -> list[SampleSentence]:
+    """Extract sample sentences following each sentence marker image.
+
+    Args:
+        sentence_markers: Sample sentence marker images, in document order
+
+    Returns:
+        List of dictionaries with 'chinese' and 'vietnamese' keys.
+    """
+    sentences = []
 
     for marker in sentence_markers:
         # Find the parent TD of the marker
@@ -122,14 +219,15 @@ def parse_sample_sentences(html_content: str) -> list[SampleSentence]:
             continue
 
         # Extract Chinese sentence from <FONT color=#FF0000> tag
-        chinese_font = chinese_td.find("font", color=lambda x: bool(x) and x.lower() == "#ff0000")
+        chinese_font = chinese_td.find("font", color=_CHINESE_COLOR_RE)
         if not chinese_font:
             continue
 
         chinese_sentence = chinese_font.get_text(strip=True)
 
-        # Find the next row (TR) which contains the Vietnamese translation
-        current_tr = marker.find_parent("tr")
+        # Find the next row (TR) which contains the Vietnamese translation. Start
+        # from the marker's TD rather than the image so the walk up isn't repeated.
+        current_tr = marker_td.find_parent("tr")
         if not current_tr:
             continue
 
@@ -138,9 +236,7 @@ def parse_sample_sentences(html_content: str) -> list[SampleSentence]:
 
         if next_tr:
             # Find <FONT COLOR=#7F7F7F> tag with Vietnamese translation
-            vietnamese_font = next_tr.find(
-                "font", color=lambda x: bool(x) and x.lower() == "#7f7f7f"
-            )
+            vietnamese_font = next_tr.find("font", color=_VIETNAMESE_COLOR_RE)
             if vietnamese_font:
                 vietnamese_sentence = vietnamese_font.get_text(strip=True)
 
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 from anki.hooks import addHook
 
 from autodefine_cn_vn.auto_fill import auto_fill
-from autodefine_cn_vn.config_manager import ConfigManager
+from autodefine_cn_vn.config_manager import get_config_manager
 
 if TYPE_CHECKING:
     from aqt.editor import Editor
@@ -26,7 +26,7 @@ def setup_editor_buttons(buttons: list[str], editor: "Editor") -> list[str]:
     Returns:
         list: Updated list of buttons
     """
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     shortcuts = config_manager.get_shortcuts()
     shortcut = shortcuts.auto_define_shortcut
 
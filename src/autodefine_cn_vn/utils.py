@@ -1,12 +1,17 @@
 """Utility functions for working with Anki notes and fields."""
 
-import inspect
-from pathlib import Path
+import os
+import sys
 
 from anki.notes import Note
 from aqt import mw
 from aqt.utils import tooltip
 
+# Field name -> index map per note type id, with the note type's modification time
+# it was built for. A newer mod replaces the entry, so renaming or reordering fields
+# rebuilds the map and the dict never holds more than one map per note type.
+_field_indexes: dict[int, tuple[int, dict[str, int]]] = {}
+
 
 def notify(message: str, period: int = 3000) -> None:
     """Show a tooltip in Anki UI and print the same message to stdout.
@@ -17,15 +22,10 @@ def notify(message: str, period: int = 3000) -> None:
         message: The message to display and print
         period: How long to show the tooltip in milliseconds (default: 3000)
     """
-    # Get caller's frame info
-    frame = inspect.currentframe()
-    if frame and frame.f_back:
-        caller_frame = frame.f_back
-        filename = Path(caller_frame.f_code.co_filename).name
-        line_number = caller_frame.f_lineno
-        formatted_message = f"[{filename}:{line_number}] {message}"
-    else:
-        formatted_message = message
+    # Get caller's frame info directly, without inspect or a Path object
+    caller_frame = sys._getframe(1)
+    filename = os.path.basename(caller_frame.f_code.co_filename)
+    formatted_message = f"[{filename}:{caller_frame.f_lineno}] {message}"
 
     tooltip(formatted_message, period=period)
     print(formatted_message)
@@ -44,9 +44,7 @@ def get_field(note: Note, field_name: str) -> str:
     Raises:
         KeyError: If the field name does not exist in the note type
     """
-    model = unwrap(note.note_type())
-    index, _ = unwrap(mw.col).models.field_map(model)[field_name]
-    return note.fields[index]
+    return note.fields[get_field_index(note, field_name)]
 
 
 def set_field(note: Note, field: str, value: str) -> None:
@@ -57,12 +55,37 @@ def set_field(note: Note, field: str, value: str) -> None:
         field: The name of the field to set
         value: The value to set in the field
 
+    Raises:
+        KeyError: If the field name does not exist in the note type
+    """
+    note.fields[get_field_index(note, field)] = value
+
+
+def get_field_index(note: Note, field_name: str) -> int:
+    """Get the index of a field in a note's fields list by field name.
+
+    The name -> index map is built once per version of the note type and reused,
+    so repeated field lookups on the same note type don't rebuild it.
+
+    Args:
+        note: The Anki note whose note type defines the fields
+        field_name: The name of the field
+
+    Returns:
+        Index of the field in note.fields
+
     Raises:
         KeyError: If the field name does not exist in the note type
     """
     model = unwrap(note.note_type())
-    index, _ = unwrap(mw.col).models.field_map(model)[field]
-    note.fields[index] = value
+    cached = _field_indexes.get(model["id"])
+    if cached is not None and cached[0] == model["mod"]:
+        indexes = cached[1]
+    else:
+        field_map = unwrap(mw.col).models.field_map(model)
+        indexes = {name: index for name, (index, _) in field_map.items()}
+        _field_indexes[model["id"]] = (model["mod"], indexes)
+    return indexes[field_name]
 
 
 def unwrap[T](obj: T | None) -> T:
@@ -1,12 +1,77 @@
 """Test configuration and shared fixtures."""
 
 import sys
-from unittest.mock import MagicMock
-
-# Mock Anki modules before any imports
-sys.modules["anki"] = MagicMock()
-sys.modules["anki.hooks"] = MagicMock()
-sys.modules["anki.notes"] = MagicMock()
-sys.modules["aqt"] = MagicMock()
-sys.modules["aqt.qt"] = MagicMock()
-sys.modules["aqt.utils"] = MagicMock()
+import types
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+
+def _fake_module(name: str, **attrs) -> types.ModuleType:
+    """Register a stand-in module exposing only the given attributes."""
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    parent_name, _, child_name = name.rpartition(".")
+    if parent_name:
+        setattr(sys.modules[parent_name], child_name, module)
+    return module
+
+
+class _Note:
+    """Stand-in for anki.notes.Note, used only in type annotations."""
+
+
+class _QAction:
+    """Stand-in for aqt.qt.QAction; never instantiated because mw is None."""
+
+
+# Fake the Anki modules before any addon imports. Only the names the addon uses
+# exist, so reaching for any other Anki API fails loudly instead of returning a mock.
+# mw is None as it is before Anki's main window exists; tests patch it per module.
+_fake_module("anki")
+_fake_module("anki.hooks", addHook=lambda hook_name, func: None)
+_fake_module("anki.notes", Note=_Note)
+_fake_module("aqt", mw=None)
+_fake_module("aqt.qt", QAction=_QAction)
+_fake_module("aqt.utils", showInfo=lambda text: None, tooltip=lambda msg, period=3000: None)
+
+
+@pytest.fixture(autouse=True)
+def clear_cached_config():
+    """Clear the process-wide config cache so each test sees its own mocked config."""
+    from autodefine_cn_vn.config_manager import clear_config_cache
+
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_cached_pages():
+    """Clear cached webpages so each test sees its own mocked responses."""
+    from autodefine_cn_vn.fetcher import fetch_webpage
+
+    fetch_webpage.cache_clear()
+    yield
+    fetch_webpage.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def lookup_cache(tmp_path):
+    """Give each test its own empty persistent lookup cache."""
+    from autodefine_cn_vn.lookup_cache import LookupCache
+
+    cache = LookupCache(tmp_path / "lookup_cache.sqlite")
+    with patch("autodefine_cn_vn.auto_fill.get_lookup_cache", return_value=cache):
+        yield cache
+
+
+@pytest.fixture(scope="session")
+def vndic_assets() -> dict[str, str]:
+    """Read each saved vndic.net page once for the whole test session, keyed by file stem."""
+    assets_dir = Path(__file__).parent / "assets"
+    return {
+        path.stem: path.read_text(encoding="utf-8") for path in assets_dir.glob("vndic_net_*.html")
+    }
@@ -6,14 +6,18 @@ import pytest
 
 from autodefine_cn_vn.auto_fill import (
     auto_fill,
+    download_audio,
     fill_audio_field,
     fill_pinyin_field,
     fill_sentence_field,
     fill_vietnamese_field,
     get_chinese_text,
+    get_parse_fields,
     insert_into_field,
+    lookup_dictionary_content,
 )
 from autodefine_cn_vn.config_manager import FieldMapping
+from autodefine_cn_vn.parser import ParseFields
 
 
 def get_field_mapping() -> FieldMapping:
@@ -88,6 +92,17 @@ class TestGetChineseText:
         chinese_text = get_chinese_text(mock_editor)
         assert chinese_text == "你好"
 
+    def test_uses_given_field_mapping(self, mock_editor):
+        """Test that get_chinese_text reads the field from a passed-in mapping."""
+        mock_editor.note.fields[1] = "nǐhǎo"
+        field_mapping = FieldMapping(chinese_field="Pinyin")
+
+        with patch("autodefine_cn_vn.auto_fill.get_config_manager") as mock_get_config_manager:
+            chinese_text = get_chinese_text(mock_editor, field_mapping)
+
+        assert chinese_text == "nǐhǎo"
+        mock_get_config_manager.assert_not_called()
+
     def test_returns_empty_string_when_no_note(self, mock_mw):
         """Test that get_chinese_text returns empty string when editor has no note."""
         editor = MagicMock()
@@ -108,6 +123,20 @@ class TestGetChineseText:
         assert chinese_text == ""
 
 
+class TestGetParseFields:
+    """Tests for get_parse_fields function."""
+
+    def test_all_fields_configured(self):
+        """Test that every part is parsed when every target field is configured."""
+        assert get_parse_fields(get_field_mapping()) == ParseFields.ALL
+
+    def test_only_configured_fields(self):
+        """Test that unconfigured target fields are not parsed."""
+        field_mapping = FieldMapping(chinese_field="Chinese", pinyin_field="Pinyin")
+
+        assert get_parse_fields(field_mapping) == ParseFields.PINYIN
+
+
 class TestInsertIntoField:
     """Tests for insert_into_field function."""
 
@@ -136,6 +165,13 @@ class TestInsertIntoField:
         assert mock_editor.note.fields[1] == "new"
         mock_editor.loadNote.assert_called_once()
 
+    def test_skips_reload_when_load_note_false(self, mock_editor):
+        """Test that insert_into_field leaves the editor reload to the caller."""
+        insert_into_field(mock_editor, "拼音", "Pinyin", overwrite=True, load_note=False)
+
+        assert mock_editor.note.fields[1] == "拼音"
+        mock_editor.loadNote.assert_not_called()
+
     def test_handles_field_not_found(self, mock_editor, mock_mw):
         """Test that insert_into_field handles field not found gracefully."""
         with patch("autodefine_cn_vn.auto_fill.notify") as mock_notify:
@@ -348,7 +384,7 @@ class TestFillAudioField:
                 parsed_data,
                 get_field_mapping(),
                 "你好",
-                "http://2.vndic.net/index.php?word={}&dict=cn_vi",
+                "http://2.vndic.net",
                 10,
             )
 
@@ -359,7 +395,7 @@ class TestFillAudioField:
                 mock_editor.note,
                 "http://example.com/audio.mp3",
                 "你好",
-                "http://2.vndic.net/index.php?word={}&dict=cn_vi",
+                "http://2.vndic.net",
                 10,
             )
 
@@ -372,7 +408,7 @@ class TestFillAudioField:
             parsed_data,
             get_field_mapping(),
             "你好",
-            "http://2.vndic.net/index.php?word={}&dict=cn_vi",
+            "http://2.vndic.net",
             10,
         )
 
@@ -388,7 +424,7 @@ class TestFillAudioField:
             parsed_data,
             get_field_mapping(),
             "你好",
-            "http://2.vndic.net/index.php?word={}&dict=cn_vi",
+            "http://2.vndic.net",
             10,
         )
 
@@ -411,7 +447,7 @@ class TestFillAudioField:
             parsed_data,
             get_field_mapping(),
             "你好",
-            "http://2.vndic.net/index.php?word={}&dict=cn_vi",
+            "http://2.vndic.net",
             10,
         )
 
@@ -436,7 +472,7 @@ class TestFillAudioField:
                 parsed_data,
                 get_field_mapping(),
                 "你好",
-                "http://2.vndic.net/index.php?word={}&dict=cn_vi",
+                "http://2.vndic.net",
                 10,
             )
 
@@ -459,7 +495,7 @@ class TestFillAudioField:
             parsed_data,
             field_mapping,
             "你好",
-            "http://2.vndic.net/index.php?word={}&dict=cn_vi",
+            "http://2.vndic.net",
             10,
         )
 
@@ -467,6 +503,48 @@ class TestFillAudioField:
         mock_editor.loadNote.assert_not_called()
 
 
+class TestDownloadAudio:
+    """Tests for download_audio function."""
+
+    def test_downloads_and_writes_audio(self):
+        """Test that download_audio fetches audio and saves it to the media collection."""
+        note = MagicMock()
+        note.col.media.have.return_value = False
+        note.col.media.write_data.return_value = "autodefine_cn_vn_你好.mp3"
+
+        with patch("autodefine_cn_vn.auto_fill.fetch_audio") as mock_fetch_audio:
+            mock_fetch_audio.return_value = b"audio"
+            filename = download_audio(
+                note,
+                "/mp3.php?id=123",
+                "你好",
+                "http://2.vndic.net",
+                10,
+            )
+
+        assert filename == "autodefine_cn_vn_你好.mp3"
+        mock_fetch_audio.assert_called_once_with("/mp3.php?id=123", "http://2.vndic.net", 10)
+        note.col.media.write_data.assert_called_once_with("autodefine_cn_vn_你好.mp3", b"audio")
+
+    def test_reuses_existing_media_file(self):
+        """Test that download_audio skips the download when the file already exists."""
+        note = MagicMock()
+        note.col.media.have.return_value = True
+
+        with patch("autodefine_cn_vn.auto_fill.fetch_audio") as mock_fetch_audio:
+            filename = download_audio(
+                note,
+                "/mp3.php?id=123",
+                "你好",
+                "http://2.vndic.net",
+                10,
+            )
+
+        assert filename == "autodefine_cn_vn_你好.mp3"
+        mock_fetch_audio.assert_not_called()
+        note.col.media.write_data.assert_not_called()
+
+
 @pytest.fixture
 def mock_fetch_webpage():
     """Mock fetch_webpage function."""
@@ -512,6 +590,24 @@ class TestAutoDefine:
         assert "Successfully filled" in mock_notify.call_args[0][0]
         assert "你好" in mock_notify.call_args[0][0]
 
+    def test_reloads_editor_once_for_all_fields(
+        self, mock_editor, mock_fetch_webpage, mock_parse_dictionary_content, mock_notify
+    ):
+        """Test that auto_fill refreshes the editor once after filling every field."""
+        mock_fetch_webpage.return_value = "<html>dictionary content</html>"
+        mock_parse_dictionary_content.return_value = {
+            "pinyin": "nǐhǎo",
+            "vietnamese": ["xin chào"],
+            "audio_url": "",
+            "sentences": [{"chinese": "你好吗？", "vietnamese": "Bạn khỏe không?"}],
+        }
+
+        auto_fill(mock_editor)
+
+        assert mock_editor.note.fields[1:3] == ["nǐhǎo", "xin chào"]
+        assert mock_editor.note.fields[4] == "<b>你好</b>吗？"
+        mock_editor.loadNote.assert_called_once()
+
     def test_shows_error_when_no_chinese_text(self, mock_editor, mock_notify):
         """Test that auto_fill shows error when no Chinese text found."""
         mock_editor.note.fields[0] = ""  # Empty Chinese field
@@ -521,6 +617,20 @@ class TestAutoDefine:
         mock_notify.assert_called_once()
         assert "No Chinese text" in mock_notify.call_args[0][0]
 
+    def test_skips_fetch_when_no_target_fields_configured(
+        self, mock_editor, mock_fetch_webpage, mock_notify
+    ):
+        """Test that auto_fill doesn't fetch anything when only the source field is set."""
+        field_mapping = FieldMapping(chinese_field="Chinese")
+
+        with patch("autodefine_cn_vn.auto_fill.get_config_manager") as mock_get_config_manager:
+            mock_get_config_manager.return_value.get_field_mapping.return_value = field_mapping
+            auto_fill(mock_editor)
+
+        mock_fetch_webpage.assert_not_called()
+        mock_notify.assert_called_once()
+        assert "No target fields configured" in mock_notify.call_args[0][0]
+
     def test_shows_warning_when_no_data_found(
         self, mock_editor, mock_fetch_webpage, mock_parse_dictionary_content, mock_notify
     ):
@@ -589,3 +699,27 @@ class TestAutoDefine:
         # Verify fetch_webpage was called with correct arguments
         expected_url = "http://2.vndic.net/index.php?word=%E4%BD%A0%E5%A5%BD&dict=cn_vi"
         mock_fetch_webpage.assert_called_once_with(expected_url, 10)
+
+
+class TestLookupDictionaryContent:
+    """Tests for lookup_dictionary_content function."""
+
+    def test_fetches_once_then_uses_cache(
+        self, mock_fetch_webpage, mock_parse_dictionary_content, lookup_cache
+    ):
+        """Test that a repeat lookup is served from the persistent cache."""
+        mock_fetch_webpage.return_value = "<html>content</html>"
+        mock_parse_dictionary_content.return_value = {
+            "pinyin": "nǐhǎo",
+            "vietnamese": ["xin chào"],
+            "audio_url": "",
+            "sentences": [],
+        }
+        url = "http://2.vndic.net/index.php?word=%E4%BD%A0%E5%A5%BD&dict=cn_vi"
+
+        first = lookup_dictionary_content(url, 10, ParseFields.ALL)
+        second = lookup_dictionary_content(url, 10, ParseFields.PINYIN)
+
+        assert first == second
+        mock_fetch_webpage.assert_called_once_with(url, 10)
+        assert lookup_cache.get(url, ParseFields.ALL) == first
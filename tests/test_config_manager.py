@@ -4,7 +4,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from autodefine_cn_vn.config_manager import ConfigManager
+from autodefine_cn_vn.config_manager import (
+    ApiSettings,
+    ConfigManager,
+    clear_config_cache,
+    get_config_manager,
+)
 
 
 @pytest.fixture
@@ -73,6 +78,14 @@ class TestConfigManager:
         assert api_settings.timeout_seconds == 10
         assert api_settings.max_retries == 3
 
+    def test_api_settings_derive_base_url_from_source(self):
+        """Test that ApiSettings precomputes the site's base URL from the source template."""
+        api_settings = ApiSettings(
+            source="https://example.com/lookup?word={}", timeout_seconds=10, max_retries=3
+        )
+
+        assert api_settings.base_url == "https://example.com"
+
     def test_reload_config_refreshes_from_anki(self, mock_mw):
         """Test that reload_config refreshes config from Anki."""
         config_manager = ConfigManager()
@@ -101,6 +114,52 @@ class TestConfigManager:
         assert mock_mw.addonManager.getConfig.call_count == initial_call_count + 1
         assert config_manager._config.field_mapping.chinese_field == "UpdatedChinese"
 
+    def test_reload_config_keeps_config_when_unchanged(self, mock_mw):
+        """Test that reload_config doesn't rebuild the config if Anki's copy is unchanged."""
+        config_manager = ConfigManager()
+        initial_config = config_manager.get_config()
+
+        config_manager.reload_config()
+
+        assert mock_mw.addonManager.getConfig.call_count == 2
+        assert config_manager.get_config() is initial_config
+
+    def test_reload_config_keeps_shared_instance(self, mock_mw):
+        """Test that reloading the shared manager doesn't replace it."""
+        manager = get_config_manager()
+
+        manager.reload_config()
+
+        assert get_config_manager() is manager
+
+    def test_config_is_read_once_across_instances(self, mock_mw):
+        """Test that multiple ConfigManager instances share one config read."""
+        first = ConfigManager()
+        second = ConfigManager()
+
+        mock_mw.addonManager.getConfig.assert_called_once_with("autodefine_cn_vn")
+        assert first.get_field_mapping() == second.get_field_mapping()
+
+    def test_clear_config_cache_forces_reread(self, mock_mw):
+        """Test that clear_config_cache makes the next ConfigManager re-read config."""
+        ConfigManager()
+        clear_config_cache()
+        ConfigManager()
+
+        assert mock_mw.addonManager.getConfig.call_count == 2
+
+    def test_get_config_manager_returns_shared_instance(self, mock_mw):
+        """Test that get_config_manager returns the same instance on every call."""
+        assert get_config_manager() is get_config_manager()
+        mock_mw.addonManager.getConfig.assert_called_once_with("autodefine_cn_vn")
+
+    def test_clear_config_cache_resets_shared_instance(self, mock_mw):
+        """Test that clear_config_cache makes get_config_manager build a new instance."""
+        first = get_config_manager()
+        clear_config_cache()
+
+        assert get_config_manager() is not first
+
     def test_optional_fields_default_to_none(self, mock_mw):
         """Test that optional fields default to None when not provided in config."""
         mock_mw.addonManager.getConfig.return_value = {
@@ -1,67 +1,71 @@
 """Tests for fetcher module."""
 
 import urllib.error
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
+import urllib3
 
+from autodefine_cn_vn import fetcher
 from autodefine_cn_vn.fetcher import fetch_audio, fetch_webpage, format_url
 
+URL_TEMPLATE = "http://2.vndic.net/index.php?word={}&dict=cn_vi"
+
 
 class TestFormatUrl:
     """Test suite for URL formatting function."""
 
-    def test_format_url_with_simple_chinese_word(self):
-        """Test URL formatting with a simple Chinese word."""
-        url_template = "http://2.vndic.net/index.php?word={}&dict=cn_vi"
-        chinese_word = "你好"
-
-        result = format_url(url_template, chinese_word)
+    @pytest.mark.parametrize(
+        ("chinese_word", "expected"),
+        [
+            ("你好", "http://2.vndic.net/index.php?word=%E4%BD%A0%E5%A5%BD&dict=cn_vi"),
+            (
+                "我爱学习中文",
+                "http://2.vndic.net/index.php?word="
+                "%E6%88%91%E7%88%B1%E5%AD%A6%E4%B9%A0%E4%B8%AD%E6%96%87&dict=cn_vi",
+            ),
+            ("", "http://2.vndic.net/index.php?word=&dict=cn_vi"),
+            ("你好！", "http://2.vndic.net/index.php?word=%E4%BD%A0%E5%A5%BD%EF%BC%81&dict=cn_vi"),
+        ],
+        ids=["simple_word", "complex_phrase", "empty_string", "special_characters"],
+    )
+    def test_format_url(self, chinese_word, expected):
+        """Test that the URL-encoded word is inserted at the template's placeholder."""
+        assert format_url(URL_TEMPLATE, chinese_word) == expected
 
-        assert result == "http://2.vndic.net/index.php?word=%E4%BD%A0%E5%A5%BD&dict=cn_vi"
+    def test_format_url_without_placeholder(self):
+        """Test that a template without a placeholder is returned unchanged."""
+        url_template = "http://2.vndic.net/index.php"
 
-    def test_format_url_with_complex_chinese_phrase(self):
-        """Test URL formatting with a complex Chinese phrase."""
-        url_template = "http://2.vndic.net/index.php?word={}&dict=cn_vi"
-        chinese_word = "我爱学习中文"
+        result = format_url(url_template, "你好")
 
-        result = format_url(url_template, chinese_word)
-
-        assert (
-            result
-            == "http://2.vndic.net/index.php?word=%E6%88%91%E7%88%B1%E5%AD%A6%E4%B9%A0%E4%B8%AD%E6%96%87&dict=cn_vi"
-        )
+        assert result == "http://2.vndic.net/index.php"
 
-    def test_format_url_with_empty_string(self):
-        """Test URL formatting with an empty string."""
-        url_template = "http://2.vndic.net/index.php?word={}&dict=cn_vi"
-        chinese_word = ""
 
-        result = format_url(url_template, chinese_word)
+class FakeResponse:
+    """Minimal stand-in for a urllib3 response."""
 
-        assert result == "http://2.vndic.net/index.php?word=&dict=cn_vi"
+    def __init__(self, data: bytes, status: int = 200):
+        self.data = data
+        self.status = status
+        self.reason = "OK" if status < 400 else "Not Found"
+        self.headers = {}
 
-    def test_format_url_with_special_characters(self):
-        """Test URL formatting with special characters."""
-        url_template = "http://2.vndic.net/index.php?word={}&dict=cn_vi"
-        chinese_word = "你好！"
 
-        result = format_url(url_template, chinese_word)
-
-        assert result == "http://2.vndic.net/index.php?word=%E4%BD%A0%E5%A5%BD%EF%BC%81&dict=cn_vi"
+@pytest.fixture
+def mock_http(monkeypatch):
+    """Replace the shared connection pool with a mock."""
+    mock = MagicMock()
+    monkeypatch.setattr(fetcher, "_HTTP", mock)
+    return mock
 
 
 class TestFetchWebpage:
     """Test suite for webpage fetching function."""
 
-    @patch("autodefine_cn_vn.fetcher.urllib.request.urlopen")
-    def test_fetch_webpage_success(self, mock_urlopen):
+    def test_fetch_webpage_success(self, mock_http):
         """Test successful webpage fetching."""
-        # Mock the response
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"<html><body>Test content</body></html>"
-        mock_response.__enter__.return_value = mock_response
-        mock_urlopen.return_value = mock_response
+        mock_http.request.return_value = FakeResponse(b"<html><body>Test content</body></html>")
 
         url = "http://2.vndic.net/index.php?word=你好&dict=cn_vi"
         timeout = 10
@@ -69,17 +73,13 @@ class TestFetchWebpage:
         result = fetch_webpage(url, timeout)
 
         assert result == "<html><body>Test content</body></html>"
-        mock_urlopen.assert_called_once()
+        mock_http.request.assert_called_once()
 
-    @patch("autodefine_cn_vn.fetcher.urllib.request.urlopen")
-    def test_fetch_webpage_with_utf8_content(self, mock_urlopen):
+    def test_fetch_webpage_with_utf8_content(self, mock_http):
         """Test fetching webpage with UTF-8 content."""
         # Mock the response with Vietnamese text
         vietnamese_html = "<html><body>Xin chào 你好</body></html>"
-        mock_response = MagicMock()
-        mock_response.read.return_value = vietnamese_html.encode("utf-8")
-        mock_response.__enter__.return_value = mock_response
-        mock_urlopen.return_value = mock_response
+        mock_http.request.return_value = FakeResponse(vietnamese_html.encode("utf-8"))
 
         url = "http://2.vndic.net/index.php?word=你好&dict=cn_vi"
         timeout = 10
@@ -90,10 +90,11 @@ class TestFetchWebpage:
         assert "Xin chào" in result
         assert "你好" in result
 
-    @patch("autodefine_cn_vn.fetcher.urllib.request.urlopen")
-    def test_fetch_webpage_timeout_error(self, mock_urlopen):
-        """Test handling of timeout errors."""
-        mock_urlopen.side_effect = urllib.error.URLError("Timeout")
+    def test_fetch_webpage_timeout_error(self, mock_http):
+        """Test that urllib3 timeouts are raised as URLError."""
+        mock_http.request.side_effect = urllib3.exceptions.MaxRetryError(
+            pool=None, url="/", reason=urllib3.exceptions.ReadTimeoutError(None, "/", "Timeout")
+        )
 
         url = "http://2.vndic.net/index.php?word=你好&dict=cn_vi"
         timeout = 10
@@ -101,38 +102,41 @@ class TestFetchWebpage:
         with pytest.raises(urllib.error.URLError):
             fetch_webpage(url, timeout)
 
-    @patch("autodefine_cn_vn.fetcher.urllib.request.urlopen")
-    def test_fetch_webpage_http_error(self, mock_urlopen):
+    def test_fetch_webpage_connection_error(self, mock_http):
+        """Test that other urllib3 errors are raised as URLError."""
+        mock_http.request.side_effect = urllib3.exceptions.ProtocolError("Connection aborted")
+
+        url = "http://2.vndic.net/index.php?word=你好&dict=cn_vi"
+
+        with pytest.raises(urllib.error.URLError):
+            fetch_webpage(url, 10)
+
+    def test_fetch_webpage_http_error(self, mock_http):
         """Test handling of HTTP errors (404, 500, etc.)."""
-        mock_urlopen.side_effect = urllib.error.HTTPError(
-            url="http://test.com", code=404, msg="Not Found", hdrs={}, fp=None
-        )
+        mock_http.request.return_value = FakeResponse(b"", status=404)
 
         url = "http://2.vndic.net/index.php?word=你好&dict=cn_vi"
         timeout = 10
 
-        with pytest.raises(urllib.error.HTTPError):
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
             fetch_webpage(url, timeout)
 
-    @patch("autodefine_cn_vn.fetcher.urllib.request.urlopen")
-    def test_fetch_webpage_uses_timeout(self, mock_urlopen):
-        """Test that fetch_webpage passes timeout to urlopen."""
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"<html></html>"
-        mock_response.__enter__.return_value = mock_response
-        mock_urlopen.return_value = mock_response
+        assert exc_info.value.code == 404
+
+    def test_fetch_webpage_uses_timeout(self, mock_http):
+        """Test that fetch_webpage passes timeout to the connection pool."""
+        mock_http.request.return_value = FakeResponse(b"<html></html>")
 
         url = "http://2.vndic.net/index.php?word=你好&dict=cn_vi"
         timeout = 15
 
         fetch_webpage(url, timeout)
 
-        # Verify timeout was passed to urlopen
-        call_args = mock_urlopen.call_args
+        # Verify timeout was passed to the request
+        call_args = mock_http.request.call_args
         assert call_args[1]["timeout"] == timeout
 
-    @patch("autodefine_cn_vn.fetcher.urllib.request.urlopen")
-    def test_fetch_webpage_handles_malformed_utf8(self, mock_urlopen):
+    def test_fetch_webpage_handles_malformed_utf8(self, mock_http):
         """Test that fetch_webpage handles malformed UTF-8 sequences."""
         # Create content with invalid UTF-8 bytes (incomplete sequence)
         # This simulates the issue found with words like 斯 and 讨厌
@@ -142,10 +146,7 @@ class TestFetchWebpage:
             b'</title></head><body><font color="#7F0000">[s\xc4\xab]</font>'
             b'<img src="img/dict/CB1FF077.png"><td>test</td></body></html>'
         )
-        mock_response = MagicMock()
-        mock_response.read.return_value = malformed_content
-        mock_response.__enter__.return_value = mock_response
-        mock_urlopen.return_value = mock_response
+        mock_http.request.return_value = FakeResponse(malformed_content)
 
         url = "http://2.vndic.net/index.php?word=斯&dict=cn_vi"
         timeout = 10
@@ -160,19 +161,46 @@ class TestFetchWebpage:
         # Invalid bytes should be replaced with Unicode replacement character
         assert "\ufffd" in result or "�" in result
 
+    def test_fetch_webpage_caches_by_url(self, mock_http):
+        """Test that repeat lookups of the same URL are served from the cache."""
+        mock_http.request.return_value = FakeResponse(b"<html>cached</html>")
+
+        url = "http://2.vndic.net/index.php?word=你好&dict=cn_vi"
+
+        assert fetch_webpage(url, 10) == "<html>cached</html>"
+        assert fetch_webpage(url, 10) == "<html>cached</html>"
+        mock_http.request.assert_called_once()
+
+        fetch_webpage.cache_clear()
+        fetch_webpage(url, 10)
+        assert mock_http.request.call_count == 2
+
+    def test_fetch_webpage_does_not_cache_errors(self, mock_http):
+        """Test that a failed fetch is retried on the next lookup."""
+        mock_http.request.side_effect = [
+            FakeResponse(b"", status=500),
+            FakeResponse(b"<html>ok</html>"),
+        ]
+
+        url = "http://2.vndic.net/index.php?word=你好&dict=cn_vi"
+
+        with pytest.raises(urllib.error.HTTPError):
+            fetch_webpage(url, 10)
+        assert fetch_webpage(url, 10) == "<html>ok</html>"
+
+    def test_requests_compressed_responses(self):
+        """Test that the shared pool asks the server for gzip-compressed bodies."""
+        assert "gzip" in fetcher._HTTP.headers["accept-encoding"]
+
 
 class TestFetchAudio:
     """Test suite for audio fetching function."""
 
-    @patch("autodefine_cn_vn.fetcher.urllib.request.urlopen")
-    def test_fetch_audio_success(self, mock_urlopen):
+    def test_fetch_audio_success(self, mock_http):
         """Test successful audio fetching."""
         # Mock the response with fake MP3 data
         mock_audio_data = b"\xff\xfb\x90\x00"  # Fake MP3 header
-        mock_response = MagicMock()
-        mock_response.read.return_value = mock_audio_data
-        mock_response.__enter__.return_value = mock_response
-        mock_urlopen.return_value = mock_response
+        mock_http.request.return_value = FakeResponse(mock_audio_data)
 
         audio_url = "/mp3.php?id=E4BDA0E4BBAC&dir=390&lang=cn&"
         base_url = "http://2.vndic.net"
@@ -182,17 +210,13 @@ class TestFetchAudio:
 
         assert result == mock_audio_data
         # Verify full URL was constructed correctly
-        call_args = mock_urlopen.call_args
-        assert call_args[0][0] == "http://2.vndic.net/mp3.php?id=E4BDA0E4BBAC&dir=390&lang=cn&"
+        call_args = mock_http.request.call_args
+        assert call_args[0][1] == "http://2.vndic.net/mp3.php?id=E4BDA0E4BBAC&dir=390&lang=cn&"
 
-    @patch("autodefine_cn_vn.fetcher.urllib.request.urlopen")
-    def test_fetch_audio_with_absolute_url(self, mock_urlopen):
+    def test_fetch_audio_with_absolute_url(self, mock_http):
         """Test fetching audio when URL is already absolute."""
         mock_audio_data = b"\xff\xfb\x90\x00"
-        mock_response = MagicMock()
-        mock_response.read.return_value = mock_audio_data
-        mock_response.__enter__.return_value = mock_response
-        mock_urlopen.return_value = mock_response
+        mock_http.request.return_value = FakeResponse(mock_audio_data)
 
         audio_url = "http://example.com/audio.mp3"
         base_url = "http://2.vndic.net"
@@ -202,13 +226,14 @@ class TestFetchAudio:
 
         assert result == mock_audio_data
         # Verify absolute URL was used as-is
-        call_args = mock_urlopen.call_args
-        assert call_args[0][0] == "http://example.com/audio.mp3"
+        call_args = mock_http.request.call_args
+        assert call_args[0][1] == "http://example.com/audio.mp3"
 
-    @patch("autodefine_cn_vn.fetcher.urllib.request.urlopen")
-    def test_fetch_audio_timeout_error(self, mock_urlopen):
+    def test_fetch_audio_timeout_error(self, mock_http):
         """Test handling of timeout errors during audio fetch."""
-        mock_urlopen.side_effect = urllib.error.URLError("Timeout")
+        mock_http.request.side_effect = urllib3.exceptions.MaxRetryError(
+            pool=None, url="/", reason=urllib3.exceptions.ReadTimeoutError(None, "/", "Timeout")
+        )
 
         audio_url = "/mp3.php?id=E4BDA0E4BBAC&dir=390&lang=cn&"
         base_url = "http://2.vndic.net"
@@ -217,12 +242,9 @@ class TestFetchAudio:
         with pytest.raises(urllib.error.URLError):
             fetch_audio(audio_url, base_url, timeout)
 
-    @patch("autodefine_cn_vn.fetcher.urllib.request.urlopen")
-    def test_fetch_audio_http_error(self, mock_urlopen):
+    def test_fetch_audio_http_error(self, mock_http):
         """Test handling of HTTP errors during audio fetch."""
-        mock_urlopen.side_effect = urllib.error.HTTPError(
-            url="http://test.com", code=404, msg="Not Found", hdrs={}, fp=None
-        )
+        mock_http.request.return_value = FakeResponse(b"", status=404)
 
         audio_url = "/mp3.php?id=E4BDA0E4BBAC&dir=390&lang=cn&"
         base_url = "http://2.vndic.net"
@@ -0,0 +1,137 @@
+"""Tests for lookup_cache module."""
+
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+from autodefine_cn_vn.lookup_cache import (
+    CACHE_FILENAME,
+    CACHE_VERSION,
+    LookupCache,
+    get_lookup_cache,
+)
+from autodefine_cn_vn.parser import ParseFields
+
+URL = "http://2.vndic.net/index.php?word=%E4%BD%A0%E5%A5%BD&dict=cn_vi"
+
+CONTENT = {
+    "pinyin": "nǐhǎo",
+    "vietnamese": ["xin chào"],
+    "audio_url": "/mp3.php?id=123",
+    "sentences": [{"chinese": "你好吗？", "vietnamese": "Bạn khỏe không?"}],
+}
+
+
+class TestLookupCache:
+    """Test suite for LookupCache."""
+
+    def test_get_returns_none_when_missing(self, tmp_path):
+        """Test that an unknown URL is a cache miss."""
+        cache = LookupCache(tmp_path / CACHE_FILENAME)
+
+        assert cache.get(URL, ParseFields.ALL) is None
+
+    def test_put_then_get_round_trips_content(self, tmp_path):
+        """Test that stored content is returned unchanged."""
+        cache = LookupCache(tmp_path / CACHE_FILENAME)
+
+        cache.put(URL, ParseFields.ALL, CONTENT)
+
+        assert cache.get(URL, ParseFields.ALL) == CONTENT
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that lookups survive reopening the database."""
+        LookupCache(tmp_path / CACHE_FILENAME).put(URL, ParseFields.ALL, CONTENT)
+
+        assert LookupCache(tmp_path / CACHE_FILENAME).get(URL, ParseFields.ALL) == CONTENT
+
+    def test_get_requires_requested_fields(self, tmp_path):
+        """Test that a partial parse doesn't satisfy a request for more fields."""
+        cache = LookupCache(tmp_path / CACHE_FILENAME)
+
+        cache.put(URL, ParseFields.PINYIN | ParseFields.VIETNAMESE, CONTENT)
+
+        assert cache.get(URL, ParseFields.PINYIN) == CONTENT
+        assert cache.get(URL, ParseFields.PINYIN | ParseFields.AUDIO) is None
+
+    def test_get_ignores_expired_entries(self, tmp_path):
+        """Test that entries older than the TTL are cache misses."""
+        cache = LookupCache(tmp_path / CACHE_FILENAME, ttl_seconds=60)
+
+        with patch("autodefine_cn_vn.lookup_cache.time.time", return_value=1000):
+            cache.put(URL, ParseFields.ALL, CONTENT)
+        with patch("autodefine_cn_vn.lookup_cache.time.time", return_value=1061):
+            assert cache.get(URL, ParseFields.ALL) is None
+
+    def test_put_skips_empty_lookups(self, tmp_path):
+        """Test that a lookup that found nothing is not cached."""
+        cache = LookupCache(tmp_path / CACHE_FILENAME)
+        empty = {"pinyin": "", "vietnamese": [], "audio_url": "", "sentences": []}
+
+        cache.put(URL, ParseFields.ALL, empty)
+
+        assert cache.get(URL, ParseFields.ALL) is None
+
+    def test_get_ignores_other_cache_versions(self, tmp_path):
+        """Test that rows written under a different CACHE_VERSION are cache misses."""
+        cache = LookupCache(tmp_path / CACHE_FILENAME)
+        cache.put(URL, ParseFields.ALL, CONTENT)
+
+        with patch("autodefine_cn_vn.lookup_cache.CACHE_VERSION", CACHE_VERSION + 1):
+            assert cache.get(URL, ParseFields.ALL) is None
+
+    def test_rows_from_unversioned_databases_are_misses(self, tmp_path):
+        """Test that a database created before rows were versioned is upgraded."""
+        db_path = tmp_path / "unversioned.sqlite"
+        conn = sqlite3.connect(db_path)
+        with conn:
+            conn.execute(
+                "CREATE TABLE lookups ("
+                "url TEXT PRIMARY KEY, fetched_at INTEGER, fields INTEGER, content TEXT)"
+            )
+            conn.execute(
+                "INSERT INTO lookups VALUES (?, ?, ?, ?)", (URL, 2**40, ParseFields.ALL.value, "{}")
+            )
+        conn.close()
+
+        cache = LookupCache(db_path)
+
+        assert cache.get(URL, ParseFields.ALL) is None
+        cache.put(URL, ParseFields.ALL, CONTENT)
+        assert cache.get(URL, ParseFields.ALL) == CONTENT
+
+    def test_clear_removes_entries(self, tmp_path):
+        """Test that clear empties the cache."""
+        cache = LookupCache(tmp_path / CACHE_FILENAME)
+        cache.put(URL, ParseFields.ALL, CONTENT)
+
+        cache.clear()
+
+        assert cache.get(URL, ParseFields.ALL) is None
+
+    def test_unusable_database_is_a_miss(self, tmp_path):
+        """Test that database errors are treated as cache misses."""
+        cache = LookupCache(tmp_path / "missing_dir" / CACHE_FILENAME)
+
+        cache.put(URL, ParseFields.ALL, CONTENT)
+
+        assert cache.get(URL, ParseFields.ALL) is None
+
+
+class TestGetLookupCache:
+    """Test suite for get_lookup_cache."""
+
+    def test_stores_database_in_user_files(self, tmp_path):
+        """Test that the shared cache lives in the addon's user_files folder."""
+        mw = MagicMock()
+        mw.addonManager.addonsFolder.return_value = str(tmp_path)
+
+        get_lookup_cache.cache_clear()
+        try:
+            with patch("autodefine_cn_vn.lookup_cache.mw", mw):
+                cache = get_lookup_cache()
+                cache.put(URL, ParseFields.ALL, CONTENT)
+        finally:
+            get_lookup_cache.cache_clear()
+
+        mw.addonManager.addonsFolder.assert_called_once_with("autodefine_cn_vn")
+        assert (tmp_path / "user_files" / CACHE_FILENAME).exists()
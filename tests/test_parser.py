@@ -1,8 +1,16 @@
 """Tests for parser module."""
 
-from pathlib import Path
+from unittest.mock import patch
 
-from autodefine_cn_vn.parser import parse_dictionary_content, parse_sample_sentences
+import bs4
+import pytest
+
+from autodefine_cn_vn.parser import (
+    HTML_PARSER,
+    ParseFields,
+    parse_dictionary_content,
+    parse_sample_sentences,
+)
 
 
 class TestParseDictionaryContent:
@@ -85,52 +93,31 @@ class TestParseDictionaryContent:
         assert result["pinyin"] == ""
         assert result["vietnamese"] == []
 
-    def test_parse_real_dictionary_page(self):
-        """Test parsing a real dictionary page HTML (公斤 = kilogram)."""
-        # This is the actual HTML structure from vndic.net for the word 公斤
-        asset_path = Path(__file__).parent / "assets" / "vndic_net_gongjin.html"
-        html_content = asset_path.read_text(encoding="utf-8")
-
-        result = parse_dictionary_content(html_content)
-
-        assert result["pinyin"] == "gōngjīn"
-        vietnamese_text = " ".join(result["vietnamese"])
-        assert "ki-lô-gam" in vietnamese_text
-        assert "国际公制重量或质量主单位" in vietnamese_text
-
-    def test_parse_real_dictionary_page_nimen(self):
-        """Test parsing a real dictionary page HTML (你们 = you plural)."""
-        # This is the actual HTML structure from vndic.net for the word 你们
-        asset_path = Path(__file__).parent / "assets" / "vndic_net_nimen.html"
-        html_content = asset_path.read_text(encoding="utf-8")
-
-        result = parse_dictionary_content(html_content)
-
-        assert result["pinyin"] == "nǐ·men"
-        vietnamese_text = " ".join(result["vietnamese"])
-        assert "các ông" in vietnamese_text
-        assert "các bà" in vietnamese_text
-        assert "代词" in vietnamese_text
-
-    def test_parse_real_dictionary_page_ni(self):
-        """Test parsing a real dictionary page HTML (你 = you)."""
-        # This is the actual HTML structure from vndic.net for the word 你
-        asset_path = Path(__file__).parent / "assets" / "vndic_net_ni.html"
-        html_content = asset_path.read_text(encoding="utf-8")
-
-        result = parse_dictionary_content(html_content)
-
-        assert result["pinyin"] == "nǐ"
+    @pytest.mark.parametrize(
+        ("asset", "pinyin", "substrings"),
+        [
+            # 公斤 = kilogram
+            ("vndic_net_gongjin", "gōngjīn", ["ki-lô-gam", "国际公制重量或质量主单位"]),
+            # 你们 = you (plural)
+            ("vndic_net_nimen", "nǐ·men", ["các ông", "các bà", "代词"]),
+            # 你 = you
+            ("vndic_net_ni", "nǐ", ["anh", "chị", "称对方(一个人)"]),
+        ],
+        ids=["gongjin", "nimen", "ni"],
+    )
+    def test_parse_real_dictionary_page(self, vndic_assets, asset, pinyin, substrings):
+        """Test parsing real dictionary page HTML saved from vndic.net."""
+        result = parse_dictionary_content(vndic_assets[asset])
+
+        assert result["pinyin"] == pinyin
         vietnamese_text = " ".join(result["vietnamese"])
-        assert "anh" in vietnamese_text
-        assert "chị" in vietnamese_text
-        assert "称对方(一个人)" in vietnamese_text
+        for substring in substrings:
+            assert substring in vietnamese_text
 
-    def test_parse_multiple_definitions(self):
+    def test_parse_multiple_definitions(self, vndic_assets):
         """Test parsing dictionary content with multiple definitions."""
         # The word 你 has 2 definitions in the real HTML
-        asset_path = Path(__file__).parent / "assets" / "vndic_net_ni.html"
-        html_content = asset_path.read_text(encoding="utf-8")
+        html_content = vndic_assets["vndic_net_ni"]
 
         result = parse_dictionary_content(html_content)
 
@@ -156,6 +143,28 @@ class TestParseDictionaryContent:
 
         assert result["audio_url"] == "/mp3.php?id=E4BDA0E4BBAC&dir=390&lang=cn&"
 
+    def test_parse_audio_url_unescapes_entities(self):
+        """Test that HTML entities in the onclick handler are decoded."""
+        html_content = """
+        <SPAN style="cursor:pointer;" ONCLICK="soundManager.play('/mp3.php?id=E4BDA0&amp;dir=437&amp;lang=cn&amp;');">
+            <img src="/images/loa.png" border="0"/>
+        </SPAN>
+        """
+
+        result = parse_dictionary_content(html_content)
+
+        assert result["audio_url"] == "/mp3.php?id=E4BDA0&dir=437&lang=cn&"
+
+    def test_parse_audio_url_ignores_scripts(self):
+        """Test that soundManager calls outside a span's onclick are ignored."""
+        html_content = """
+        <script>soundManager.play('/mp3.php?id=ignored');</script>
+        """
+
+        result = parse_dictionary_content(html_content)
+
+        assert result["audio_url"] == ""
+
     def test_parse_audio_url_missing(self):
         """Test parsing when audio URL is missing."""
         html_content = "<html><body>No audio here</body></html>"
@@ -164,10 +173,9 @@ class TestParseDictionaryContent:
 
         assert result["audio_url"] == ""
 
-    def test_parse_real_dictionary_page_with_audio(self):
+    def test_parse_real_dictionary_page_with_audio(self, vndic_assets):
         """Test parsing a real dictionary page HTML with audio URL (你们 = you plural)."""
-        asset_path = Path(__file__).parent / "assets" / "vndic_net_nimen.html"
-        html_content = asset_path.read_text(encoding="utf-8")
+        html_content = vndic_assets["vndic_net_nimen"]
 
         result = parse_dictionary_content(html_content)
 
@@ -176,10 +184,9 @@ class TestParseDictionaryContent:
         assert "các ông" in vietnamese_text
         assert result["audio_url"] == "/mp3.php?id=E4BDA0E4BBAC&dir=390&lang=cn&"
 
-    def test_parse_dictionary_content_with_sentences(self):
+    def test_parse_dictionary_content_with_sentences(self, vndic_assets):
         """Test that parse_dictionary_content includes sample sentences."""
-        asset_path = Path(__file__).parent / "assets" / "vndic_net_nimen.html"
-        html_content = asset_path.read_text(encoding="utf-8")
+        html_content = vndic_assets["vndic_net_nimen"]
 
         result = parse_dictionary_content(html_content)
 
@@ -205,6 +212,52 @@ class TestParseDictionaryContent:
         assert result["vietnamese"] == ["xin chào"]
         assert result["sentences"] == []
 
+    def test_html_parser_fallback_gives_same_result(self, vndic_assets):
+        """Test that the html.parser fallback parses real pages the same way as lxml."""
+        pytest.importorskip("lxml")
+        assert HTML_PARSER == "lxml"
+        html_content = vndic_assets["vndic_net_nimen"]
+
+        result = parse_dictionary_content(html_content)
+        with patch("autodefine_cn_vn.parser.HTML_PARSER", "html.parser"):
+            fallback_result = parse_dictionary_content(html_content)
+
+        assert fallback_result == result
+
+    def test_parse_dictionary_content_parses_html_once(self, vndic_assets):
+        """Test that definitions and sentences are extracted from a single parse."""
+        html_content = vndic_assets["vndic_net_nimen"]
+
+        with patch("bs4.BeautifulSoup", wraps=bs4.BeautifulSoup) as mock_soup:
+            result = parse_dictionary_content(html_content)
+
+        assert mock_soup.call_count == 1
+        assert result["vietnamese"]
+        assert len(result["sentences"]) == 2
+
+    def test_parse_dictionary_content_only_requested_fields(self, vndic_assets):
+        """Test that parts not requested via fields are left empty."""
+        html_content = vndic_assets["vndic_net_nimen"]
+
+        result = parse_dictionary_content(
+            html_content, fields=ParseFields.PINYIN | ParseFields.AUDIO
+        )
+
+        assert result["pinyin"] == "nǐ·men"
+        assert result["audio_url"] == "/mp3.php?id=E4BDA0E4BBAC&dir=390&lang=cn&"
+        assert result["vietnamese"] == []
+        assert result["sentences"] == []
+
+    def test_parse_dictionary_content_sentences_only(self, vndic_assets):
+        """Test extracting only sample sentences."""
+        html_content = vndic_assets["vndic_net_nimen"]
+
+        result = parse_dictionary_content(html_content, fields=ParseFields.SENTENCES)
+
+        assert result["pinyin"] == ""
+        assert result["vietnamese"] == []
+        assert result["sentences"] == parse_sample_sentences(html_content)
+
     def test_parse_dictionary_content_missing_chinese_word(self):
         """Test parsing when Chinese word cannot be extracted."""
         html_content = """
@@ -257,6 +310,23 @@ class TestParseSampleSentences:
 
         assert result == []
 
+    @pytest.mark.parametrize("html_parser", ["lxml", "html.parser"])
+    def test_parse_sample_sentences_stops_at_table_end(self, html_parser):
+        """Test that a sentence in a table's last row gets no translation from the next table."""
+        if html_parser == "lxml":
+            pytest.importorskip("lxml")
+        html_content = """
+        <TABLE><TR><TD class="tacon" colspan=2> </TD><TD class="tacon"><IMG src=img/dict/72B02D27.png></TD>
+        <TD class="tacon"><FONT color=#FF0000>我爱你。</FONT></TD></TR></TABLE>
+        <TABLE><TR><TD class="tacon" colspan=3 width=54> </TD>
+        <TD class="tacon"><FONT COLOR=#7F7F7F>Bảng khác.</FONT></TD></TR></TABLE>
+        """
+
+        with patch("autodefine_cn_vn.parser.HTML_PARSER", html_parser):
+            result = parse_sample_sentences(html_content)
+
+        assert result == [{"chinese": "我爱你。", "vietnamese": ""}]
+
     def test_parse_sample_sentences_basic(self):
         """Test parsing a basic sample sentence."""
         html_content = """
@@ -302,10 +372,9 @@ class TestParseSampleSentences:
         assert result[0]["chinese"] == "你好"
         assert result[0]["vietnamese"] == "Xin chào"
 
-    def test_parse_sample_sentences_from_real_nimen_html(self):
+    def test_parse_sample_sentences_from_real_nimen_html(self, vndic_assets):
         """Test parsing sample sentences from real vndic.net HTML (你们 = you plural)."""
-        asset_path = Path(__file__).parent / "assets" / "vndic_net_nimen.html"
-        html_content = asset_path.read_text(encoding="utf-8")
+        html_content = vndic_assets["vndic_net_nimen"]
 
         result = parse_sample_sentences(html_content)
 
@@ -0,0 +1,111 @@
+"""Tests for the release script."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# The release script imports its sibling modules the way `python scripts/release.py` does
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from release import Version, check_working_directory_clean, update_version_in_file  # noqa: E402
+
+
+def git(repo: Path, *args: str) -> None:
+    """Run a git command in the given repository."""
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """Create a git repository with one commit and run the test inside it."""
+    (tmp_path / "notes.md").write_text("notes\n")
+    (tmp_path / "vhong_todo.md").write_text("todo\n")
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "initial")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestCheckWorkingDirectoryClean:
+    """Test suite for check_working_directory_clean."""
+
+    def test_clean_repository(self, git_repo):
+        """Test that a repository without changes is clean."""
+        assert check_working_directory_clean()
+
+    def test_ignores_todo_file(self, git_repo):
+        """Test that changes to vhong_todo.md alone are ignored."""
+        (git_repo / "vhong_todo.md").write_text("todo\nmore\n")
+
+        assert check_working_directory_clean()
+
+    def test_modified_file(self, git_repo):
+        """Test that a modified file makes the repository dirty."""
+        (git_repo / "notes.md").write_text("changed\n")
+
+        assert not check_working_directory_clean()
+
+    def test_rename(self, git_repo):
+        """Test that a staged rename makes the repository dirty."""
+        git(git_repo, "mv", "notes.md", "renamed.md")
+
+        assert not check_working_directory_clean()
+
+    def test_rename_to_todo_file(self, git_repo):
+        """Test that a rename's original path isn't read as a separate status entry."""
+        # The original path's field has no "XY " prefix, so slicing it like a
+        # status entry would turn "abcvhong_todo.md" into "vhong_todo.md"
+        git(git_repo, "rm", "-q", "vhong_todo.md")
+        (git_repo / "abcvhong_todo.md").write_text("todo\n")
+        git(git_repo, "add", "abcvhong_todo.md")
+        git(git_repo, "commit", "-q", "-m", "move todo")
+        git(git_repo, "mv", "abcvhong_todo.md", "vhong_todo.md")
+
+        assert not check_working_directory_clean()
+
+
+class TestUpdateVersionInFile:
+    """Test suite for update_version_in_file."""
+
+    PYPROJECT = '[project]\nname = "autodefine-cn-vn"\nversion = "0.2.2"\n'
+
+    def test_updates_version(self, tmp_path):
+        """Test that the version line is rewritten and no temporary file remains."""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        pyproject_path = project_dir / "pyproject.toml"
+        pyproject_path.write_text(self.PYPROJECT)
+        pyproject_path.chmod(0o644)
+
+        update_version_in_file(pyproject_path, Version(0, 3, 0))
+
+        assert pyproject_path.read_text() == self.PYPROJECT.replace("0.2.2", "0.3.0")
+        assert pyproject_path.stat().st_mode & 0o777 == 0o644
+        assert list(project_dir.iterdir()) == [pyproject_path]
+
+    def test_removes_temporary_file_on_failure(self, tmp_path, monkeypatch):
+        """Test that a failed replace leaves pyproject.toml untouched and no temporary file."""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        pyproject_path = project_dir / "pyproject.toml"
+        pyproject_path.write_text(self.PYPROJECT)
+
+        def fail_replace(src, dst):
+            raise OSError("replace failed")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+
+        with pytest.raises(OSError, match="replace failed"):
+            update_version_in_file(pyproject_path, Version(0, 3, 0))
+
+        assert pyproject_path.read_text() == self.PYPROJECT
+        assert list(project_dir.iterdir()) == [pyproject_path]
@@ -4,7 +4,14 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from autodefine_cn_vn.utils import get_field, notify, set_field, unwrap
+from autodefine_cn_vn.utils import (
+    _field_indexes,
+    get_field,
+    get_field_index,
+    notify,
+    set_field,
+    unwrap,
+)
 
 
 @pytest.fixture
@@ -83,6 +90,42 @@ class TestSetField:
             set_field(mock_note, "NonExistentField", "value")
 
 
+class TestGetFieldIndex:
+    """Tests for get_field_index function."""
+
+    def test_reuses_index_map_for_same_note_type(self, mock_mw, mock_note):
+        """Test that the field map is built once per note type version."""
+        mock_note.note_type.return_value = {"id": 1001, "mod": 1}
+
+        assert get_field_index(mock_note, "Chinese") == 0
+        assert get_field_index(mock_note, "Audio") == 3
+
+        mock_mw.col.models.field_map.assert_called_once()
+
+    def test_rebuilds_index_map_when_note_type_changes(self, mock_mw, mock_note):
+        """Test that editing the note type invalidates the cached field map."""
+        mock_note.note_type.return_value = {"id": 1002, "mod": 1}
+        assert get_field_index(mock_note, "Pinyin") == 1
+
+        # Simulate the user reordering fields, which bumps the note type's mod time
+        mock_mw.col.models.field_map.return_value = {"Pinyin": (0, {}), "Chinese": (1, {})}
+        mock_note.note_type.return_value = {"id": 1002, "mod": 2}
+
+        assert get_field_index(mock_note, "Pinyin") == 0
+        assert mock_mw.col.models.field_map.call_count == 2
+
+    def test_keeps_one_index_map_per_note_type(self, mock_mw, mock_note):
+        """Test that a newer note type version replaces the older cached map."""
+        cached_note_types = len(_field_indexes)
+
+        for mod in range(1, 4):
+            mock_note.note_type.return_value = {"id": 1003, "mod": mod}
+            get_field_index(mock_note, "Chinese")
+
+        assert len(_field_indexes) == cached_note_types + 1
+        assert _field_indexes[1003][0] == 3
+
+
 class TestUnwrap:
     """Tests for unwrap function."""
 